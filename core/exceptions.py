@@ -13,7 +13,7 @@ class SchemaParsingError(MendaxException):
     pass
 
 
-class CircularDependencyError(MendaxException):
+class CircularDependencyError(MendaxException, ValueError):
     """Raised when circular dependencies are detected in schema."""
     
     def __init__(self, tables: list[str], message: str = None):
@@ -23,7 +23,7 @@ class CircularDependencyError(MendaxException):
         super().__init__(message)
 
 
-class InvalidSchemaError(MendaxException):
+class InvalidSchemaError(MendaxException, ValueError):
     """Raised when schema is invalid or empty."""
     pass
 
@@ -0,0 +1,49 @@
+# Generated by Django 5.2.8 on 2026-10-15 10:30
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = [
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='SchemaUpload',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('schema_file', models.FileField(upload_to='schemas/')),
+                ('db_type', models.CharField(choices=[('mysql', 'MySQL'), ('postgres', 'PostgreSQL')], default='mysql', max_length=50)),
+                ('num_records', models.PositiveIntegerField(default=100)),
+                ('uploaded_at', models.DateTimeField(auto_now_add=True)),
+                ('user', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.CASCADE, to=settings.AUTH_USER_MODEL)),
+            ],
+        ),
+        migrations.CreateModel(
+            name='GenerationResult',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('output_file', models.FileField(upload_to='outputs/')),
+                ('status', models.CharField(choices=[('pending', 'Pending'), ('processing', 'Processing'), ('completed', 'Completed'), ('failed', 'Failed')], default='pending', max_length=20)),
+                ('error_message', models.TextField(blank=True, null=True)),
+                ('generated_at', models.DateTimeField(auto_now_add=True)),
+                ('schema', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='results', to='core.schemaupload')),
+            ],
+        ),
+        migrations.CreateModel(
+            name='TaskLog',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('task_id', models.CharField(max_length=255)),
+                ('log_message', models.TextField()),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('schema', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, to='core.schemaupload')),
+            ],
+        ),
+    ]
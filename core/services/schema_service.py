@@ -5,14 +5,15 @@ Orchestrates schema parsing, dependency graph building, data generation,
 and SQL export in a unified service interface.
 """
 
-from typing import Dict, List, Any, Optional
+from typing import Dict, List, Any, Optional, TextIO, Iterator, Tuple
 from datetime import datetime
 
 from core.exceptions import InvalidSchemaError, DataGenerationError
-from core.utils.parser import parse_sql_schema
-from core.utils.graph.dependency_graph import DependencyGraph
+from core.utils.parser import parse_sql_schema, clear_schema_cache
+from core.utils.graph import clear_order_cache, get_insertion_order
 from core.utils.generators.data_generator import DataGenerator
 from core.utils.generators.config import GeneratorConfig
+from core.utils.generators.table_data import TableData
 from core.utils.exporters.sql_exporter import SQLInsertBuilder
 
 
@@ -30,7 +31,8 @@ class SchemaService:
     def __init__(
         self,
         generator_config: Optional[GeneratorConfig] = None,
-        sql_dialect: str = 'mysql'
+        sql_dialect: str = 'mysql',
+        batch_size: int = 500
     ):
         """
         Initialize schema service.
@@ -38,17 +40,66 @@ class SchemaService:
         Args:
             generator_config: Configuration for data generator (uses default if not provided)
             sql_dialect: SQL dialect for export ('mysql', 'postgres', etc.)
+            batch_size: Maximum number of rows per exported INSERT statement
         """
         self.generator_config = generator_config or GeneratorConfig()
         self.sql_dialect = sql_dialect
+        self.batch_size = batch_size
         self.generator = DataGenerator(self.generator_config)
-        self.exporter = SQLInsertBuilder(self.sql_dialect)
+        self.exporter = SQLInsertBuilder(self.sql_dialect, batch_size=self.batch_size)
+    
+    def _parse_schema(self, sql_content: str) -> Dict[str, Dict[str, Any]]:
+        """
+        Parse SQL schema, reusing the result for content parsed before.
+        
+        parse_sql_schema caches parsed schemas by content and returns a copy
+        per call, so the result belongs to the caller.
+        
+        Args:
+            sql_content: SQL schema content
+            
+        Returns:
+            Parsed schema dictionary
+            
+        Raises:
+            InvalidSchemaError: If schema is invalid or empty
+        """
+        schema = parse_sql_schema(sql_content)
+        if not schema:
+            raise InvalidSchemaError("No valid tables found in SQL schema.")
+        return schema
+    
+    def _analyze_schema(self, sql_content: str) -> Tuple[Dict[str, Dict[str, Any]], List[str]]:
+        """
+        Parse SQL schema and compute its insertion order.
+        
+        Both steps are cached process-wide (by parse_sql_schema and
+        get_insertion_order), so analyzing known content again is cheap.
+        
+        Args:
+            sql_content: SQL schema content
+            
+        Returns:
+            Tuple of (parsed schema, insertion order), both owned by the caller
+            
+        Raises:
+            InvalidSchemaError: If schema is invalid or empty
+            CircularDependencyError: If a circular dependency is detected
+        """
+        schema = self._parse_schema(sql_content)
+        return schema, get_insertion_order(schema)
+    
+    def clear_cache(self) -> None:
+        """Forget cached schema analyses: parsed schemas and insertion orders."""
+        clear_schema_cache()
+        clear_order_cache()
     
     def process_schema(
         self,
         sql_content: str,
         num_records: int = 100,
-        export_sql: bool = False
+        export_sql: bool = False,
+        sql_path: Optional[str] = None
     ) -> Dict[str, Any]:
         """
         Process SQL schema and generate data.
@@ -57,14 +108,18 @@ class SchemaService:
             sql_content: SQL schema content with CREATE TABLE statements
             num_records: Number of records to generate for each table
             export_sql: Whether to also generate SQL INSERT statements
+            sql_path: If given together with export_sql, the statements are
+                      streamed into this file instead of being returned as a string
             
         Returns:
             Dictionary containing:
             {
                 'schema': parsed schema dict,
                 'insertion_order': list of table names in order,
-                'data': generated data dict,
-                'sql': SQL INSERT statements (if export_sql=True),
+                'data': generated data dict (TableData per table when
+                        streamed to sql_path, row lists otherwise),
+                'sql': SQL INSERT statements (if export_sql=True and no sql_path),
+                'sql_path': path of the written SQL file (if export_sql=True and sql_path),
                 'metadata': {
                     'total_tables': int,
                     'total_records': int,
@@ -76,17 +131,14 @@ class SchemaService:
             InvalidSchemaError: If schema is invalid or empty
             DataGenerationError: If data generation fails
         """
-        # Step 1: Parse schema
-        schema = parse_sql_schema(sql_content)
-        if not schema:
-            raise InvalidSchemaError("No valid tables found in SQL schema.")
+        # Steps 1-2: Parse schema and build dependency graph
+        schema, insertion_order = self._analyze_schema(sql_content)
         
-        # Step 2: Build dependency graph
-        graph = DependencyGraph(schema)
-        insertion_order = graph.get_insertion_order()
-        
-        # Step 3: Generate data
-        data = self.generator.generate(sql_content, num_records)
+        # Step 3: Generate data, kept columnar when it is going to be exported
+        if export_sql:
+            data = self.generator.generate_columnar(sql_content, num_records)
+        else:
+            data = self.generator.generate(sql_content, num_records)
         
         # Prepare result
         result = {
@@ -95,15 +147,23 @@ class SchemaService:
             'data': data,
             'metadata': {
                 'total_tables': len(schema),
-                'total_records': sum(len(records) for records in data.values()),
+                'total_records': self.generator.last_total_records,
                 'generated_at': datetime.now()
             }
         }
         
         # Step 4: Export SQL if requested
-        if export_sql:
+        if export_sql and sql_path:
+            with open(sql_path, 'w', encoding='utf-8') as sql_file:
+                self._export_to_sql(data, schema, insertion_order, result['metadata'], sink=sql_file)
+            result['sql_path'] = sql_path
+        elif export_sql:
             sql_output = self._export_to_sql(data, schema, insertion_order, result['metadata'])
             result['sql'] = sql_output
+            result['data'] = {
+                table_name: table_data.to_records()
+                for table_name, table_data in data.items()
+            }
         
         return result
     
@@ -112,7 +172,8 @@ class SchemaService:
         data: Dict[str, List[Dict[str, Any]]],
         schema: Dict[str, Dict[str, Any]],
         insertion_order: List[str],
-        metadata: Dict[str, Any]
+        metadata: Dict[str, Any],
+        sink: Optional[TextIO] = None
     ) -> str:
         """
         Export generated data to SQL INSERT statements.
@@ -122,27 +183,66 @@ class SchemaService:
             schema: Parsed schema dictionary
             insertion_order: Table insertion order
             metadata: Metadata dictionary
+            sink: Optional writable text stream (e.g. an open output file) to
+                  stream the statements into instead of building a string
             
         Returns:
-            SQL string with INSERT statements
+            SQL string with INSERT statements (empty when a sink is given)
+        """
+        chunks = self.iter_sql(data, schema, insertion_order, metadata)
+        
+        if sink is None:
+            return ''.join(chunks)
+        
+        sink.writelines(chunks)
+        sink.flush()
+        return ''
+    
+    def iter_sql(
+        self,
+        data: Dict[str, List[Dict[str, Any]]],
+        schema: Dict[str, Dict[str, Any]],
+        insertion_order: List[str],
+        metadata: Dict[str, Any]
+    ) -> Iterator[str]:
+        """
+        Lazily yield the SQL export: the metadata header, then INSERT batches.
+        
+        Args:
+            data: Generated data dictionary (row lists or TableData per table)
+            schema: Parsed schema dictionary
+            insertion_order: Table insertion order
+            metadata: Metadata dictionary
+            
+        Yields:
+            SQL text chunks, in output order
         """
-        builder = SQLInsertBuilder(self.sql_dialect)
+        builder = SQLInsertBuilder(self.sql_dialect, batch_size=self.batch_size)
         
         builder.add_metadata(
             total_tables=metadata['total_tables'],
             total_records=metadata['total_records'],
             generated_at=metadata['generated_at']
         )
+        yield builder.header()
+        
+        # Resolve each table's column list once, before emitting any rows
+        columns_by_table = {
+            table_name: list(schema.get(table_name, {}).get('columns', {}))
+            for table_name in insertion_order
+        }
         
         # Add tables in insertion order
         for table_name in insertion_order:
-            records = data.get(table_name, [])
-            if records:
-                table_info = schema.get(table_name, {})
-                columns = list(table_info.get('columns', {}).keys())
-                builder.add_table(table_name, records, columns)
-        
-        return builder.build()
+            records = data.get(table_name)
+            if not records:
+                continue
+            columns = columns_by_table[table_name]
+            if isinstance(records, TableData):
+                # Columnar data streams straight from the column lists
+                yield from builder.iter_rows(table_name, columns, records.rows(columns))
+            else:
+                yield from builder.iter_table(table_name, records, columns)
     
     def parse_only(self, sql_content: str) -> Dict[str, Any]:
         """
@@ -154,17 +254,13 @@ class SchemaService:
         Returns:
             Dictionary with parsed schema and insertion order
         """
-        schema = parse_sql_schema(sql_content)
-        if not schema:
-            raise InvalidSchemaError("No valid tables found in SQL schema.")
-        
-        graph = DependencyGraph(schema)
-        insertion_order = graph.get_insertion_order()
+        schema, insertion_order = self._analyze_schema(sql_content)
         
         return {
             'schema': schema,
             'insertion_order': insertion_order,
-            'has_cycles': graph.has_cycles()
+            # Schemas with cycles raise CircularDependencyError above
+            'has_cycles': False
         }
     
     def generate_only(
@@ -188,23 +284,25 @@ class SchemaService:
         self,
         data: Dict[str, List[Dict[str, Any]]],
         schema: Dict[str, Dict[str, Any]],
-        insertion_order: List[str]
+        insertion_order: List[str],
+        sink: Optional[TextIO] = None
     ) -> str:
         """
         Export data to SQL without generating new data.
         
         Args:
-            data: Generated data dictionary
+            data: Generated data dictionary (row lists or TableData per table)
             schema: Parsed schema dictionary
             insertion_order: Table insertion order
+            sink: Optional writable text stream to write the statements to
             
         Returns:
-            SQL INSERT statements string
+            SQL INSERT statements string (empty when a sink is given)
         """
         metadata = {
             'total_tables': len(schema),
             'total_records': sum(len(records) for records in data.values()),
             'generated_at': datetime.now()
         }
-        return self._export_to_sql(data, schema, insertion_order, metadata)
+        return self._export_to_sql(data, schema, insertion_order, metadata, sink=sink)
 
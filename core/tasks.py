@@ -0,0 +1,101 @@
+"""
+Celery tasks for running schema data generation outside the request cycle.
+"""
+
+import logging
+import os
+import tempfile
+
+from celery import shared_task
+from django.core.files import File
+from django.db import transaction
+
+from core.exceptions import MendaxException
+from core.models import SchemaUpload, GenerationResult, TaskLog
+from core.services.schema_service import SchemaService
+
+logger = logging.getLogger(__name__)
+
+
+def queue_generation(schema_upload: SchemaUpload) -> GenerationResult:
+    """
+    Create a pending GenerationResult and enqueue its generation task.
+    
+    The task is only sent once the surrounding transaction commits, so the
+    worker never sees a result row that does not exist yet.
+    
+    Args:
+        schema_upload: Uploaded schema to generate data for
+        
+    Returns:
+        The pending GenerationResult; poll its status for completion
+    """
+    result = GenerationResult.objects.create(schema=schema_upload, status='pending')
+    transaction.on_commit(lambda: generate_for_schema.delay(result.pk))
+    return result
+
+
+@shared_task(bind=True)
+def generate_for_schema(self, result_id: int) -> str:
+    """
+    Generate data for a GenerationResult's schema and store the SQL output.
+    
+    Moves the result through processing -> completed/failed and writes the
+    INSERT statements to its output_file.
+    
+    Args:
+        result_id: Primary key of the GenerationResult to fill
+        
+    Returns:
+        Final status of the result
+        
+    Raises:
+        Exception: Unexpected errors are re-raised after the result is marked failed
+    """
+    result = GenerationResult.objects.select_related('schema').get(pk=result_id)
+    schema_upload = result.schema
+    task_id = self.request.id or ''
+    
+    result.status = 'processing'
+    result.save(update_fields=['status'])
+    TaskLog.objects.create(task_id=task_id, schema=schema_upload, log_message="Generation started")
+    
+    try:
+        with schema_upload.schema_file.open('rb') as schema_file:
+            sql_content = schema_file.read().decode('utf-8')
+        
+        service = SchemaService(sql_dialect=schema_upload.db_type)
+        
+        # Stream the export to a local file first, then hand it to storage
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            sql_path = os.path.join(tmp_dir, f"schema_{schema_upload.pk}_result_{result.pk}.sql")
+            service.process_schema(
+                sql_content,
+                num_records=schema_upload.num_records,
+                export_sql=True,
+                sql_path=sql_path
+            )
+            with open(sql_path, 'rb') as sql_file:
+                result.output_file.save(os.path.basename(sql_path), File(sql_file), save=False)
+        
+        result.status = 'completed'
+        result.save(update_fields=['status', 'output_file'])
+    except (MendaxException, OSError, UnicodeDecodeError) as e:
+        _mark_failed(result, task_id, e)
+        return result.status
+    except Exception as e:
+        # Unexpected errors must not leave the result stuck in 'processing'
+        logger.exception("Generation for result %s failed unexpectedly", result.pk)
+        _mark_failed(result, task_id, e)
+        raise
+    
+    TaskLog.objects.create(task_id=task_id, schema=schema_upload, log_message="Generation completed")
+    return result.status
+
+
+def _mark_failed(result: GenerationResult, task_id: str, error: Exception) -> None:
+    """Mark a result as failed with the error message and log it for its schema."""
+    result.status = 'failed'
+    result.error_message = str(error)
+    result.save(update_fields=['status', 'error_message'])
+    TaskLog.objects.create(task_id=task_id, schema=result.schema, log_message=f"Generation failed: {error}")
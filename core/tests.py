@@ -1,3 +1,98 @@
-from django.test import TestCase
+import shutil
+import tempfile
+from unittest import mock
 
-# Create your tests here.
+from django.core.files.base import ContentFile
+from django.test import TestCase, override_settings
+
+from core.models import SchemaUpload, GenerationResult, TaskLog
+from core.tasks import generate_for_schema, queue_generation
+
+
+SCHEMA_SQL = b"""
+CREATE TABLE countries (
+  id INT PRIMARY KEY,
+  name VARCHAR(100)
+);
+
+CREATE TABLE cities (
+  id INT PRIMARY KEY,
+  country_id INT,
+  FOREIGN KEY (country_id) REFERENCES countries(id)
+);
+"""
+
+
+class GenerationTaskTests(TestCase):
+    """Test cases for queueing and running the generation task."""
+    
+    def setUp(self):
+        media_root = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, media_root, ignore_errors=True)
+        settings_override = override_settings(MEDIA_ROOT=media_root)
+        settings_override.enable()
+        self.addCleanup(settings_override.disable)
+    
+    def _upload(self, content=SCHEMA_SQL):
+        upload = SchemaUpload(num_records=3)
+        upload.schema_file.save('schema.sql', ContentFile(content))
+        return upload
+    
+    def test_queue_generation_sends_task_on_commit(self):
+        """Test that a pending result is created and the task sent after commit."""
+        upload = self._upload()
+        
+        with mock.patch.object(generate_for_schema, 'delay') as delay:
+            with self.captureOnCommitCallbacks(execute=True):
+                result = queue_generation(upload)
+                delay.assert_not_called()
+        
+        self.assertEqual(result.status, 'pending')
+        delay.assert_called_once_with(result.pk)
+    
+    def test_generation_completes(self):
+        """Test the pending -> completed transition and the stored SQL output."""
+        upload = self._upload()
+        result = GenerationResult.objects.create(schema=upload, status='pending')
+        
+        self.assertEqual(generate_for_schema(result.pk), 'completed')
+        
+        result.refresh_from_db()
+        self.assertEqual(result.status, 'completed')
+        with result.output_file.open('r') as output:
+            sql = output.read()
+        self.assertIn('INSERT INTO countries', sql)
+        self.assertIn('INSERT INTO cities', sql)
+        self.assertTrue(TaskLog.objects.filter(log_message='Generation completed').exists())
+    
+    def test_generation_fails_on_invalid_schema(self):
+        """Test that schema errors mark the result as failed."""
+        upload = self._upload(b"SELECT 1;")
+        result = GenerationResult.objects.create(schema=upload, status='pending')
+        
+        self.assertEqual(generate_for_schema(result.pk), 'failed')
+        
+        result.refresh_from_db()
+        self.assertEqual(result.status, 'failed')
+        self.assertTrue(result.error_message)
+    
+    def test_unexpected_error_marks_failed(self):
+        """Test that unexpected errors are re-raised after marking the result failed."""
+        upload = self._upload()
+        result = GenerationResult.objects.create(schema=upload, status='pending')
+        statuses = []
+        
+        def fail(*args, **kwargs):
+            # The result is already marked as processing while generating
+            statuses.append(GenerationResult.objects.get(pk=result.pk).status)
+            raise KeyError('boom')
+        
+        with mock.patch('core.tasks.SchemaService.process_schema', side_effect=fail):
+            with self.assertLogs('core.tasks', level='ERROR'):
+                with self.assertRaises(KeyError):
+                    generate_for_schema(result.pk)
+        
+        self.assertEqual(statuses, ['processing'])
+        result.refresh_from_db()
+        self.assertEqual(result.status, 'failed')
+        self.assertIn('boom', result.error_message)
@@ -2,8 +2,40 @@
 SQL exporter using Builder Pattern for generating INSERT statements.
 """
 
+import io
 from datetime import datetime
-from typing import Dict, List, Any, Optional
+from itertools import islice
+from typing import Dict, List, Any, Optional, TextIO, Iterable, Iterator, Sequence
+
+
+def _format_null(value: Any) -> str:
+    return 'NULL'
+
+
+def _format_bool(value: bool) -> str:
+    return '1' if value else '0'
+
+
+def _format_datetime(value: datetime) -> str:
+    return f"'{value.strftime('%Y-%m-%d %H:%M:%S')}'"
+
+
+# Single quotes are doubled for every dialect; MySQL additionally treats
+# backslash as an escape character inside string literals. NUL characters are
+# silently dropped, since PostgreSQL rejects them in text values altogether.
+_STRING_ESCAPES = str.maketrans({"'": "''", "\x00": ""})
+_MYSQL_STRING_ESCAPES = str.maketrans({"'": "''", "\\": "\\\\", "\x00": ""})
+
+
+def _make_string_formatter(escapes: Dict[int, str]):
+    """
+    Create a formatter that escapes a value with the given translate table and quotes it.
+    
+    Note that the translate tables remove NUL characters from the value.
+    """
+    def _format_string(value: Any) -> str:
+        return "'" + str(value).translate(escapes) + "'"
+    return _format_string
 
 
 class SQLInsertBuilder:
@@ -11,18 +43,48 @@ class SQLInsertBuilder:
     Builder for generating SQL INSERT statements.
     
     Uses Builder Pattern to construct INSERT statements from generated data.
+    Statements are written to a text sink as they are built, so exporting to
+    a file never holds the whole SQL output in memory. Rows are grouped into
+    multi-row INSERT statements of up to batch_size rows each.
     """
     
-    def __init__(self, dialect: str = 'mysql'):
+    def __init__(
+        self,
+        dialect: str = 'mysql',
+        sink: Optional[TextIO] = None,
+        batch_size: int = 500
+    ):
         """
         Initialize SQL INSERT builder.
         
         Args:
-            dialect: SQL dialect ('mysql', 'postgres', etc.)
+            dialect: SQL dialect ('mysql', 'postgres', etc.); only 'mysql'
+                     escapes backslashes, and NUL characters are dropped
+                     from string values for every dialect
+            sink: Writable text stream for the output (in-memory buffer if not provided)
+            batch_size: Maximum number of rows per INSERT statement (1 = one statement per row)
         """
+        if batch_size < 1:
+            raise ValueError("batch_size must be at least 1")
+        
         self.dialect = dialect
-        self.statements = []
+        self.batch_size = batch_size
+        self._owns_sink = sink is None
+        self.sink = io.StringIO() if sink is None else sink
         self.metadata = {}
+        self._header_written = False
+        self._format_string = _make_string_formatter(
+            _MYSQL_STRING_ESCAPES if dialect == 'mysql' else _STRING_ESCAPES
+        )
+        # Exact-type dispatch for _format_value; subclasses fall back to isinstance checks
+        self._formatters = {
+            type(None): _format_null,
+            bool: _format_bool,
+            int: str,
+            float: str,
+            datetime: _format_datetime,
+            str: self._format_string,
+        }
     
     def add_table(
         self, 
@@ -33,6 +95,9 @@ class SQLInsertBuilder:
         """
         Add INSERT statements for a table.
         
+        Records are emitted as multi-row INSERT statements of up to
+        batch_size rows each.
+        
         Args:
             table_name: Name of the table
             records: List of record dictionaries
@@ -44,16 +109,73 @@ class SQLInsertBuilder:
         if not records:
             return self
         
+        if not self._owns_sink:
+            # Rows stream out immediately, so the header has to go first
+            self._write_header()
+        self.sink.writelines(self.iter_table(table_name, records, columns))
+        
+        return self
+    
+    def iter_table(
+        self,
+        table_name: str,
+        records: List[Dict[str, Any]],
+        columns: Optional[List[str]] = None
+    ) -> Iterator[str]:
+        """
+        Lazily yield the INSERT statements for a table, one per batch.
+        
+        Args:
+            table_name: Name of the table
+            records: List of record dictionaries
+            columns: Optional list of column names (uses all keys from first record if not provided)
+            
+        Yields:
+            Newline-terminated multi-row INSERT statements
+        """
+        if not records:
+            return
+        
         # Get column names
         if columns is None:
             columns = list(records[0].keys())
         
-        # Generate INSERT statement for each record
-        for record in records:
-            insert_stmt = self._build_insert(table_name, record, columns)
-            self.statements.append(insert_stmt)
+        rows = ([record.get(col) for col in columns] for record in records)
+        yield from self.iter_rows(table_name, columns, rows)
+    
+    def iter_rows(
+        self,
+        table_name: str,
+        columns: List[str],
+        rows: Iterable[Sequence[Any]]
+    ) -> Iterator[str]:
+        """
+        Lazily yield the INSERT statements for rows given as value sequences.
         
-        return self
+        Args:
+            table_name: Name of the table
+            columns: Column names, in the order of the values in each row
+            rows: Iterable of row value sequences (e.g. TableData.rows())
+            
+        Yields:
+            Newline-terminated multi-row INSERT statements
+        """
+        # The statement scaffolding is the same for every batch of the table
+        prefix = f"INSERT INTO {table_name} ({', '.join(columns)}) VALUES "
+        
+        format_value = self._format_value
+        batch_size = self.batch_size
+        
+        def format_row(row: Sequence[Any]) -> str:
+            return '(' + ', '.join(map(format_value, row)) + ')'
+        
+        # Generate one INSERT statement per batch of rows
+        remaining = iter(rows)
+        while True:
+            batch = list(islice(remaining, batch_size))
+            if not batch:
+                break
+            yield prefix + ',\n'.join(map(format_row, batch)) + ';\n'
     
     def add_metadata(
         self,
@@ -64,6 +186,10 @@ class SQLInsertBuilder:
         """
         Add metadata to the SQL output.
         
+        With the default in-memory sink the header is only rendered by
+        build(), so this may be called before or after add_table(). With an
+        external sink the header is written together with the first table.
+        
         Args:
             total_tables: Total number of tables
             total_records: Total number of records
@@ -71,7 +197,15 @@ class SQLInsertBuilder:
             
         Returns:
             Self for method chaining
+            
+        Raises:
+            ValueError: If the header was already written to an external sink
         """
+        if self._header_written:
+            raise ValueError(
+                "add_metadata() must be called before add_table() when writing to an external sink"
+            )
+        
         self.metadata = {
             'total_tables': total_tables,
             'total_records': total_records,
@@ -79,37 +213,6 @@ class SQLInsertBuilder:
         }
         return self
     
-    def _build_insert(
-        self, 
-        table_name: str, 
-        record: Dict[str, Any],
-        columns: List[str]
-    ) -> str:
-        """
-        Build a single INSERT statement.
-        
-        Args:
-            table_name: Name of the table
-            record: Record dictionary
-            columns: List of column names
-            
-        Returns:
-            SQL INSERT statement string
-        """
-        # Build column names
-        col_names = ', '.join(columns)
-        
-        # Build values
-        values = []
-        for col in columns:
-            value = record.get(col)
-            values.append(self._format_value(value))
-        
-        values_str = ', '.join(values)
-        
-        # Create INSERT statement
-        return f"INSERT INTO {table_name} ({col_names}) VALUES ({values_str});"
-    
     def _format_value(self, value: Any) -> str:
         """
         Format a Python value for SQL INSERT statement.
@@ -120,6 +223,10 @@ class SQLInsertBuilder:
         Returns:
             SQL-formatted string
         """
+        formatter = self._formatters.get(type(value))
+        if formatter is not None:
+            return formatter(value)
+        
         if value is None:
             return 'NULL'
         elif isinstance(value, bool):
@@ -127,45 +234,67 @@ class SQLInsertBuilder:
         elif isinstance(value, (int, float)):
             return str(value)
         elif isinstance(value, datetime):
-            return f"'{value.strftime('%Y-%m-%d %H:%M:%S')}'"
+            return _format_datetime(value)
         else:
-            # String - escape single quotes and wrap in quotes
-            escaped = str(value).replace("'", "''")
-            return f"'{escaped}'"
+            return self._format_string(value)
     
-    def build(self) -> str:
+    def header(self) -> str:
         """
-        Build the final SQL output with all INSERT statements.
+        Build the metadata comment header for the SQL output.
         
         Returns:
-            Complete SQL string with metadata comments and INSERT statements
+            Header comment block, including the blank lines that follow it
         """
-        output = []
+        metadata = self.metadata
+        generated_at = metadata.get('generated_at')
+        total_tables = metadata.get('total_tables')
+        total_records = metadata.get('total_records')
+        
+        header = "-- Generated INSERT statements\n"
+        if generated_at:
+            header += f"-- Generated at: {generated_at.strftime('%Y-%m-%d %H:%M:%S')}\n"
+        if total_tables:
+            header += f"-- Total tables: {total_tables}\n"
+        if total_records:
+            header += f"-- Total records: {total_records}\n"
         
-        # Add metadata comments
-        output.append("-- Generated INSERT statements")
-        if self.metadata.get('generated_at'):
-            output.append(f"-- Generated at: {self.metadata['generated_at'].strftime('%Y-%m-%d %H:%M:%S')}")
-        if self.metadata.get('total_tables'):
-            output.append(f"-- Total tables: {self.metadata['total_tables']}")
-        if self.metadata.get('total_records'):
-            output.append(f"-- Total records: {self.metadata['total_records']}")
-        output.append("")
-        output.append("")
+        return header + "\n\n"
+    
+    def _write_header(self) -> None:
+        """Write the metadata comment header to the sink (only once)."""
+        if self._header_written:
+            return
+        self._header_written = True
+        self.sink.write(self.header())
+    
+    def build(self) -> str:
+        """
+        Build the final SQL output with all INSERT statements.
         
-        # Add INSERT statements
-        output.extend(self.statements)
+        Returns:
+            Complete SQL string with metadata comments and INSERT statements.
+            When writing to an external sink the output is flushed there
+            instead and an empty string is returned.
+        """
+        if self._owns_sink:
+            # The header is rendered last so metadata may be added at any point
+            return self.header() + self.sink.getvalue()
         
-        return '\n'.join(output)
+        self._write_header()
+        self.sink.flush()
+        return ''
     
     def reset(self) -> 'SQLInsertBuilder':
         """
         Reset the builder to start fresh.
         
+        An external sink is kept as-is; only the in-memory buffer is cleared.
+        
         Returns:
             Self for method chaining
         """
-        self.statements = []
+        if self._owns_sink:
+            self.sink = io.StringIO()
         self.metadata = {}
+        self._header_written = False
         return self
-
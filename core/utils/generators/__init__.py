@@ -5,10 +5,12 @@ Data generators package for SQL schema dummy data generation.
 from core.utils.generators.config import GeneratorConfig
 from core.utils.generators.data_generator import DataGenerator
 from core.utils.generators.field_generators import FieldGeneratorFactory
+from core.utils.generators.table_data import TableData
 
 __all__ = [
     'GeneratorConfig',
     'DataGenerator',
     'FieldGeneratorFactory',
+    'TableData',
 ]
 
@@ -2,9 +2,43 @@
 Configuration for data generators.
 """
 
+import random
 from dataclasses import dataclass
-from typing import Optional
-from faker import Faker
+from typing import TYPE_CHECKING, Any, Optional
+
+if TYPE_CHECKING:
+    from faker import Faker
+
+
+class _LazyFaker:
+    """
+    Stand-in for a Faker instance that is built on first use.
+    
+    Importing Faker and loading its providers and locale data costs far more
+    than generating a few rows, so both are deferred until a value is needed.
+    """
+    
+    def __init__(self, locale: str, rng: random.Random):
+        self._locale = locale
+        self._rng = rng
+        self._faker = None
+    
+    def _load(self) -> 'Faker':
+        """Import and create the real Faker instance (once)."""
+        if self._faker is None:
+            from faker import Faker
+            
+            faker = Faker(self._locale)
+            # Draw from the config's RNG rather than Faker's shared global one
+            faker.random = self._rng
+            self._faker = faker
+        return self._faker
+    
+    def __getattr__(self, name: str) -> Any:
+        # Only reached for attributes not set in __init__
+        if name in ('_locale', '_rng', '_faker'):
+            raise AttributeError(name)
+        return getattr(self._load(), name)
 
 
 @dataclass
@@ -16,21 +50,45 @@ class GeneratorConfig:
         locale: Faker locale (e.g., 'en_US', 'fa_IR')
         seed: Random seed for reproducible data generation
         nullable_fk_probability: Probability (0.0-1.0) of setting nullable foreign keys to None
-        faker: Faker instance (auto-created if not provided)
+        rng: Random number generator shared by all generation (seeded from
+            seed if not provided)
+        faker: Faker instance (created lazily on first use if not provided,
+            drawing from rng)
+        pool_size: Number of distinct values pre-generated for name-detected
+            fields (addresses, titles, ...), and sampled from when a column has
+            more than twice as many records; None disables pooling
+        pool_strings: Also pool generic VARCHAR/TEXT columns. Off by default:
+            the parser does not record UNIQUE constraints, and pooled columns
+            repeat values
+        workers: Number of worker processes for data generation; None or 1
+            generates everything in the calling process
+        parallel_threshold: Minimum number of records in a dependency layer
+            before it is handed to worker processes
     """
     locale: str = 'en_US'
     seed: Optional[int] = None
     nullable_fk_probability: float = 0.3
-    faker: Optional[Faker] = None
+    rng: Optional[random.Random] = None
+    faker: Optional['Faker'] = None
+    pool_size: Optional[int] = 10000
+    pool_strings: bool = False
+    workers: Optional[int] = None
+    parallel_threshold: int = 50000
     
     def __post_init__(self):
-        """Initialize Faker instance if not provided."""
+        """Set up the RNG and a lazily created Faker instance if not provided."""
+        if self.rng is None:
+            self.rng = random.Random(self.seed)
         if self.faker is None:
-            self.faker = Faker(self.locale)
-            if self.seed is not None:
-                Faker.seed(self.seed)
+            self.faker = _LazyFaker(self.locale, self.rng)
         
         # Validate nullable_fk_probability
         if not 0.0 <= self.nullable_fk_probability <= 1.0:
             raise ValueError("nullable_fk_probability must be between 0.0 and 1.0")
+        
+        if self.pool_size is not None and self.pool_size < 1:
+            raise ValueError("pool_size must be a positive integer or None")
+        
+        if self.workers is not None and self.workers < 1:
+            raise ValueError("workers must be a positive integer or None")
 
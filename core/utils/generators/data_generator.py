@@ -5,14 +5,42 @@ Generates dummy data for SQL tables using Faker, respecting foreign key constrai
 and table dependencies determined by the dependency graph.
 """
 
-import random
-from typing import Dict, List, Any
+import hashlib
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, List, Any, Tuple
 
 from core.exceptions import InvalidSchemaError, DataGenerationError
 from core.utils.generators.config import GeneratorConfig
 from core.utils.generators.field_generators import FieldGeneratorFactory
+from core.utils.generators.table_data import TableData
 from core.utils.parser import parse_sql_schema
-from core.utils.graph import get_insertion_order
+from core.utils.graph import get_insertion_layers, get_insertion_order
+
+
+def _derive_seed(base_seed: int, table_name: str, shard: int) -> int:
+    """Derive a stable per-shard seed (independent of PYTHONHASHSEED)."""
+    digest = hashlib.blake2b(
+        f'{base_seed}:{table_name}:{shard}'.encode('utf-8'), digest_size=8
+    ).digest()
+    return int.from_bytes(digest, 'big')
+
+
+def _generate_shard(task: Tuple) -> TableData:
+    """
+    Worker entry point: generate one shard of a table in a child process.
+    
+    Each shard gets its own seeded Faker and RNG so results do not depend
+    on which worker runs it.
+    """
+    table_name, table_info, start, count, primary_keys, config_kwargs = task
+    config = GeneratorConfig(**config_kwargs)
+    return DataGenerator(config)._generate_table_data(
+        table_name=table_name,
+        table_info=table_info,
+        num_records=count,
+        primary_keys=primary_keys,
+        start=start
+    )
 
 
 class DataGenerator:
@@ -31,6 +59,8 @@ class DataGenerator:
         """
         self.config = config or GeneratorConfig()
         self.field_factory = FieldGeneratorFactory(self.config)
+        # Total number of records produced by the most recent generate() call
+        self.last_total_records = 0
     
     def generate(
         self, 
@@ -53,6 +83,33 @@ class DataGenerator:
                 ]
             }
             
+        Raises:
+            InvalidSchemaError: If schema is invalid or empty
+            DataGenerationError: If data generation fails
+        """
+        return {
+            table_name: table_data.to_records()
+            for table_name, table_data in self.generate_columnar(sql_content, num_records).items()
+        }
+    
+    def generate_columnar(
+        self,
+        sql_content: str,
+        num_records: int = 100
+    ) -> Dict[str, TableData]:
+        """
+        Generate dummy data for SQL schema tables in columnar form.
+        
+        Same as generate(), but each table is returned as a TableData holding
+        one list per column; row dictionaries are only built when iterated.
+        
+        Args:
+            sql_content: SQL schema content with CREATE TABLE statements
+            num_records: Number of records to generate for each table
+            
+        Returns:
+            Dictionary mapping table names to TableData
+            
         Raises:
             InvalidSchemaError: If schema is invalid or empty
             DataGenerationError: If data generation fails
@@ -69,11 +126,16 @@ class DataGenerator:
         except ValueError as e:
             raise DataGenerationError(f"Cannot generate data due to schema issues: {str(e)}")
         
+        workers = self.config.workers or 1
+        if workers > 1 and num_records * len(schema) > self.config.parallel_threshold:
+            return self._generate_in_workers(schema, num_records, workers)
+        
         # Track generated primary keys for foreign key references
         primary_keys = {}  # {table_name: [pk_value1, pk_value2, ...]}
         
         # Store generated data
         generated_data = {}
+        total_records = 0
         
         # Generate data for each table in dependency order
         for table_name in table_order:
@@ -81,7 +143,7 @@ class DataGenerator:
                 table_info = schema[table_name]
                 
                 # Generate records for this table
-                table_records = self._generate_table_records(
+                table_data = self._generate_table_data(
                     table_name=table_name,
                     table_info=table_info,
                     num_records=num_records,
@@ -89,69 +151,149 @@ class DataGenerator:
                 )
                 
                 # Store generated data
-                generated_data[table_name] = table_records
+                generated_data[table_name] = table_data
+                total_records += len(table_data)
                 
                 # Track primary keys for foreign key references
                 primary_key_col = table_info.get('primary_key')
                 if primary_key_col:
-                    primary_keys[table_name] = [
-                        record[primary_key_col] for record in table_records
-                    ]
+                    primary_keys[table_name] = table_data.columns[primary_key_col]
             except Exception as e:
                 raise DataGenerationError(f"Error generating data for table '{table_name}': {str(e)}")
         
+        self.last_total_records = total_records
+        return generated_data
+    
+    def _generate_in_workers(
+        self,
+        schema: Dict[str, Dict[str, Any]],
+        num_records: int,
+        workers: int
+    ) -> Dict[str, TableData]:
+        """
+        Generate data across worker processes, one dependency layer at a time.
+        
+        Tables within a layer only reference earlier layers, so they are
+        generated concurrently; when a layer has fewer tables than workers,
+        each table is additionally split into record-range shards. Layers
+        below the parallel threshold are generated in-process.
+        """
+        try:
+            layers = get_insertion_layers(schema)
+        except ValueError as e:
+            raise DataGenerationError(f"Cannot generate data due to schema issues: {str(e)}")
+        
+        # Without a configured seed, draw one so every shard still differs
+        base_seed = self.config.seed if self.config.seed is not None else self.config.rng.getrandbits(64)
+        primary_keys = {}
+        generated_data = {}
+        
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            for layer in layers:
+                if num_records * len(layer) <= self.config.parallel_threshold:
+                    for table_name in layer:
+                        try:
+                            generated_data[table_name] = self._generate_table_data(
+                                table_name=table_name,
+                                table_info=schema[table_name],
+                                num_records=num_records,
+                                primary_keys=primary_keys
+                            )
+                        except Exception as e:
+                            raise DataGenerationError(f"Error generating data for table '{table_name}': {str(e)}")
+                else:
+                    shards = max(1, workers // len(layer))
+                    shard_size = -(-num_records // shards)
+                    futures = []
+                    for table_name in layer:
+                        table_info = schema[table_name]
+                        referenced = {
+                            fk_info['ref_table']: primary_keys.get(fk_info['ref_table'])
+                            for fk_info in table_info.get('foreign_keys', {}).values()
+                        }
+                        for shard, start in enumerate(range(0, num_records, shard_size)):
+                            config_kwargs = {
+                                'locale': self.config.locale,
+                                'seed': _derive_seed(base_seed, table_name, shard),
+                                'nullable_fk_probability': self.config.nullable_fk_probability,
+                                'pool_size': self.config.pool_size,
+                                'pool_strings': self.config.pool_strings,
+                            }
+                            task = (
+                                table_name, table_info, start,
+                                min(shard_size, num_records - start), referenced, config_kwargs
+                            )
+                            futures.append((table_name, executor.submit(_generate_shard, task)))
+                    
+                    for table_name, future in futures:
+                        try:
+                            shard_data = future.result()
+                            if table_name in generated_data:
+                                generated_data[table_name].extend(shard_data)
+                            else:
+                                generated_data[table_name] = shard_data
+                        except Exception as e:
+                            raise DataGenerationError(f"Error generating data for table '{table_name}': {str(e)}")
+                
+                # Track primary keys for foreign key references
+                for table_name in layer:
+                    primary_key_col = schema[table_name].get('primary_key')
+                    if primary_key_col:
+                        primary_keys[table_name] = generated_data[table_name].columns[primary_key_col]
+        
+        self.last_total_records = sum(len(table_data) for table_data in generated_data.values())
         return generated_data
     
-    def _generate_table_records(
+    def _generate_table_data(
         self,
         table_name: str,
         table_info: Dict[str, Any],
         num_records: int,
-        primary_keys: Dict[str, List[Any]]
-    ) -> List[Dict[str, Any]]:
-        """Generate records for a single table."""
-        table_records = []
+        primary_keys: Dict[str, List[Any]],
+        start: int = 0
+    ) -> TableData:
+        """
+        Generate records for a single table.
+        
+        Values are generated column by column (one list per column).
+        start offsets the record numbers, so a shard of a larger table
+        continues its auto-increment primary keys.
+        """
         primary_key_col = table_info.get('primary_key')
         foreign_keys = table_info.get('foreign_keys', {})
         columns = table_info.get('columns', {})
         
-        for record_num in range(num_records):
-            record = {}
-            
-            # Generate data for each column
-            for col_name, col_type in columns.items():
-                # Skip if this is a foreign key (will be filled later)
-                if col_name in foreign_keys:
-                    continue
-                
-                # Generate value based on column type and name
-                value = self.field_factory.generate_value(
-                    col_name=col_name,
-                    col_type=col_type,
-                    is_primary_key=(col_name == primary_key_col),
-                    record_num=record_num
-                )
-                record[col_name] = value
-            
-            # Fill foreign keys with references to previously generated data
-            for fk_col, fk_info in foreign_keys.items():
-                ref_table = fk_info['ref_table']
-                ref_col = fk_info['ref_column']
-                
-                if ref_table in primary_keys and primary_keys[ref_table]:
-                    # Randomly select from available primary key values
-                    # Sometimes set to None for nullable foreign keys
-                    if random.random() < self.config.nullable_fk_probability:
-                        record[fk_col] = None
-                    else:
-                        record[fk_col] = random.choice(primary_keys[ref_table])
-                else:
-                    # No referenced data available yet (shouldn't happen with correct order)
-                    record[fk_col] = None
+        # Resolve each column's generator once for the whole table
+        plan = self.field_factory.compile_plan(
+            columns, primary_key_col=primary_key_col, skip=set(foreign_keys)
+        )
+        
+        # Generate data for each column (foreign keys are filled later)
+        column_values = {
+            col_name: batch_fn(num_records, start) for col_name, batch_fn in plan
+        }
+        
+        # Fill foreign keys with references to previously generated data
+        null_probability = self.config.nullable_fk_probability
+        rng = self.config.rng
+        for fk_col, fk_info in foreign_keys.items():
+            ref_values = primary_keys.get(fk_info['ref_table'])
             
-            table_records.append(record)
+            if ref_values:
+                # Randomly select from available primary key values in one call
+                sampled = rng.choices(ref_values, k=num_records)
+                # Sometimes set to None for nullable foreign keys
+                if null_probability > 0:
+                    draw = rng.random
+                    sampled = [
+                        None if draw() < null_probability else value for value in sampled
+                    ]
+                column_values[fk_col] = sampled
+            else:
+                # No referenced data available yet (shouldn't happen with correct order)
+                column_values[fk_col] = [None] * num_records
         
-        return table_records
+        return TableData(column_values, num_records)
 
 
 # Backward compatibility: keep the old function interface
@@ -6,22 +6,121 @@ Each field type has its own generator strategy.
 
 import re
 from abc import ABC, abstractmethod
-from typing import Any, Optional
-from faker import Faker
+from datetime import date
+from functools import lru_cache, partial
+from typing import TYPE_CHECKING, Any, Callable, Dict, FrozenSet, List, Optional, Tuple
 
 from core.utils.generators.config import GeneratorConfig
 
+if TYPE_CHECKING:
+    from faker import Faker
+
+
+_PAREN_RE = re.compile(r'\([^)]*\)')
+_LEN_RE = re.compile(r'\((\d+)\)')
+_PRECISION_SCALE_RE = re.compile(r'\((\d+)\s*,\s*(\d+)\)')
+
+# Every name keyword SmartFieldGenerator knows, matched in a single scan.
+# The lookahead reports overlapping matches; 'username' precedes 'user' so
+# the longer keyword wins where both start.
+_SMART_KEYWORD_RE = re.compile(
+    r'(?=(email|username|user|name|phone|url|address|city|country|id|'
+    r'password|hash|created_at|updated_at|date|time|description|content|'
+    r'text|title|slug|code))'
+)
+
+# (any of these keywords, none of these keywords, Faker provider, poolable),
+# by priority. Values that are usually UNIQUE in real schemas are never pooled.
+# Names whose keywords match no rule (e.g. 'city_id') are left to the
+# type-based generators rather than being filled with NULL.
+_SMART_RULES = (
+    (('email',), (), lambda faker: faker.email, False),
+    (('username',), (), lambda faker: faker.user_name, False),
+    (('name',), ('user',), lambda faker: faker.name, True),
+    (('phone',), (), lambda faker: faker.phone_number, True),
+    (('url',), (), lambda faker: faker.url, True),
+    (('address',), (), lambda faker: faker.address, True),
+    (('city',), ('id',), lambda faker: faker.city, True),
+    (('country',), ('id',), lambda faker: faker.country, True),
+    (('password', 'hash'), (), lambda faker: partial(faker.password, length=20), True),
+    (('created_at', 'updated_at'), (),
+     lambda faker: partial(faker.date_time_between, start_date='-1y', end_date='now'), True),
+    (('date',), ('id',), lambda faker: faker.date, True),
+    (('time',), ('id',), lambda faker: faker.time, True),
+    (('description', 'content', 'text'), (),
+     lambda faker: partial(faker.text, max_nb_chars=200), True),
+    (('title',), (), lambda faker: partial(faker.sentence, nb_words=3), True),
+    (('slug',), (), lambda faker: faker.slug, False),
+    (('code',), ('id',), lambda faker: faker.country_code, True),
+)
+
+
+@lru_cache(maxsize=256)
+def _parse_type(col_type: str) -> Tuple[str, Optional[int]]:
+    """
+    Parse a column type into its base name and declared length.
+    
+    e.g. 'varchar(50)' -> ('VARCHAR', 50), 'DATETIME' -> ('DATETIME', None).
+    Schemas only use a handful of distinct type strings, so results are cached.
+    """
+    upper = col_type.upper()
+    length_match = _LEN_RE.search(upper)
+    return _PAREN_RE.sub('', upper).strip(), int(length_match.group(1)) if length_match else None
+
+
+# Version 4 / RFC 4122 variant bits, as set by uuid.UUID(int=..., version=4)
+_UUID4_CLEAR = ~((0xf000 << 64) | (0xc000 << 48))
+_UUID4_SET = (0x4000 << 64) | (0x8000 << 48)
+
+
+def _uuid4_strings(getrandbits: Callable[[int], int], count: int) -> List[str]:
+    """
+    Generate UUID4 strings in bulk.
+    
+    Produces exactly what faker.uuid4() does for the same RNG state, without
+    building a uuid.UUID object per value.
+    """
+    uuids = []
+    append = uuids.append
+    for _ in range(count):
+        h = '%032x' % ((getrandbits(128) & _UUID4_CLEAR) | _UUID4_SET)
+        append(f'{h[:8]}-{h[8:12]}-{h[12:16]}-{h[16:20]}-{h[20:]}')
+    return uuids
+
+
+@lru_cache(maxsize=1024)
+def _match_smart_rule(col_name_lower: str) -> Optional[int]:
+    """
+    Return the index of the first _SMART_RULES entry matching a column name.
+    
+    Column names such as 'id', 'name' or 'created_at' repeat across tables,
+    so matches are cached per name.
+    """
+    found = set(_SMART_KEYWORD_RE.findall(col_name_lower))
+    if not found:
+        return None
+    
+    for index, (keywords, excluded, _, _) in enumerate(_SMART_RULES):
+        if not found.isdisjoint(keywords) and found.isdisjoint(excluded):
+            return index
+    
+    return None
+
 
 class FieldGenerator(ABC):
     """Base class for field value generators."""
     
-    def __init__(self, faker: Faker):
+    # Base SQL types handled by this generator
+    base_types: FrozenSet[str] = frozenset()
+    
+    def __init__(self, faker: 'Faker', pool_size: Optional[int] = None):
         self.faker = faker
+        self.pool_size = pool_size
+        self._pools: Dict[Any, List[Any]] = {}
     
-    @abstractmethod
     def can_handle(self, col_name: str, col_type: str) -> bool:
         """Check if this generator can handle the given column."""
-        pass
+        return _parse_type(col_type)[0] in self.base_types
     
     @abstractmethod
     def generate(
@@ -34,6 +133,58 @@ class FieldGenerator(ABC):
     ) -> Any:
         """Generate a value for the column."""
         pass
+    
+    def bind(self, col_name: str, col_type: str) -> Optional[Callable[[int], Any]]:
+        """
+        Bind this generator to a column.
+        
+        Returns a function producing a value from the record number, with
+        everything that is constant for the column resolved up front, or
+        None if this generator has no value for the column.
+        """
+        generate = self.generate
+        return lambda record_num: generate(col_name, col_type, record_num=record_num)
+    
+    def bind_batch(self, col_name: str, col_type: str) -> Optional[Callable[..., List[Any]]]:
+        """
+        Bind this generator to a column for whole-column generation.
+        
+        Returns a function (num_records, start=0) producing the values for
+        records start..start+num_records-1 as a list. Generators with a
+        cheaper bulk path override this; the default calls the bound
+        per-record function once per record.
+        """
+        value_fn = self.bind(col_name, col_type)
+        if value_fn is None:
+            return None
+        return lambda num_records, start=0: [
+            value_fn(record_num) for record_num in range(start, start + num_records)
+        ]
+    
+    def _pooled_batch(self, key: Any, provider: Callable[[], Any]) -> Callable[..., List[Any]]:
+        """
+        Build a batch function over provider() that pools values for large columns.
+        
+        A column of more than twice pool_size records is sampled from pool_size
+        pre-generated values, shared by every column with the same key; smaller
+        columns (or pool_size=None) call the provider once per record.
+        """
+        pool_size = self.pool_size
+        if pool_size is None:
+            return lambda num_records, start=0: [provider() for _ in range(num_records)]
+        
+        choices = self.faker.random.choices
+        
+        def generate_column(num_records: int, start: int = 0) -> List[Any]:
+            # Pooling only pays off once the column is much larger than the pool
+            if num_records <= pool_size * 2:
+                return [provider() for _ in range(num_records)]
+            pool = self._pools.get(key)
+            if pool is None:
+                pool = self._pools[key] = [provider() for _ in range(pool_size)]
+            return choices(pool, k=num_records)
+        
+        return generate_column
 
 
 class PrimaryKeyGenerator(FieldGenerator):
@@ -52,29 +203,34 @@ class PrimaryKeyGenerator(FieldGenerator):
     ) -> Any:
         if not is_primary_key:
             return None
+        return self.bind(col_name, col_type)(record_num)
+    
+    def bind(self, col_name: str, col_type: str) -> Optional[Callable[[int], Any]]:
+        base_type, _ = _parse_type(col_type)
         
-        base_type = re.sub(r'\([^)]*\)', '', col_type.upper()).strip()
-        
-        if base_type in ['INT', 'INTEGER', 'BIGINT', 'SMALLINT', 'TINYINT', 'MEDIUMINT']:
-            return record_num + 1  # Auto-increment
-        elif base_type in ['VARCHAR', 'CHAR', 'TEXT']:
-            return self.faker.uuid4()
-        else:
-            return record_num + 1
+        if base_type in ['VARCHAR', 'CHAR', 'TEXT']:
+            uuid4 = self.faker.uuid4
+            return lambda record_num: uuid4()
+        # Auto-increment for integer (and any other) primary keys
+        return lambda record_num: record_num + 1
+    
+    def bind_batch(self, col_name: str, col_type: str) -> Optional[Callable[..., List[Any]]]:
+        if _parse_type(col_type)[0] in ['VARCHAR', 'CHAR', 'TEXT']:
+            getrandbits = self.faker.random.getrandbits
+            return lambda num_records, start=0: _uuid4_strings(getrandbits, num_records)
+        return lambda num_records, start=0: list(range(start + 1, start + num_records + 1))
 
 
 class SmartFieldGenerator(FieldGenerator):
-    """Generator that detects field type from column name."""
+    """
+    Generator that detects field type from column name.
+    
+    For large columns, values of poolable keywords are sampled from a pool
+    of pool_size pre-generated values instead of calling Faker per record.
+    """
     
     def can_handle(self, col_name: str, col_type: str) -> bool:
-        col_name_lower = col_name.lower()
-        smart_keywords = [
-            'email', 'username', 'name', 'phone', 'url', 'address',
-            'city', 'country', 'password', 'hash', 'created_at', 'updated_at',
-            'date', 'time', 'description', 'content', 'text', 'title',
-            'slug', 'code'
-        ]
-        return any(keyword in col_name_lower for keyword in smart_keywords)
+        return self._match_rule(col_name) is not None
     
     def generate(
         self, 
@@ -84,50 +240,43 @@ class SmartFieldGenerator(FieldGenerator):
         record_num: int = 0,
         **kwargs
     ) -> Any:
-        col_name_lower = col_name.lower()
-        
-        if 'email' in col_name_lower:
-            return self.faker.email()
-        elif 'username' in col_name_lower:
-            return self.faker.user_name()
-        elif 'name' in col_name_lower and 'user' not in col_name_lower:
-            return self.faker.name()
-        elif 'phone' in col_name_lower:
-            return self.faker.phone_number()
-        elif 'url' in col_name_lower or 'link' in col_name_lower:
-            return self.faker.url()
-        elif 'address' in col_name_lower:
-            return self.faker.address()
-        elif 'city' in col_name_lower and 'id' not in col_name_lower:
-            return self.faker.city()
-        elif 'country' in col_name_lower and 'id' not in col_name_lower:
-            return self.faker.country()
-        elif 'password' in col_name_lower or 'hash' in col_name_lower:
-            return self.faker.password(length=20)
-        elif 'created_at' in col_name_lower or 'updated_at' in col_name_lower:
-            return self.faker.date_time_between(start_date='-1y', end_date='now')
-        elif 'date' in col_name_lower and 'id' not in col_name_lower:
-            return self.faker.date()
-        elif 'time' in col_name_lower and 'id' not in col_name_lower:
-            return self.faker.time()
-        elif 'description' in col_name_lower or 'content' in col_name_lower or 'text' in col_name_lower:
-            return self.faker.text(max_nb_chars=200)
-        elif 'title' in col_name_lower:
-            return self.faker.sentence(nb_words=3)
-        elif 'slug' in col_name_lower:
-            return self.faker.slug()
-        elif 'code' in col_name_lower and 'id' not in col_name_lower:
-            return self.faker.country_code()
+        provider = self._resolve_provider(col_name)
+        if provider is None:
+            return None  # Fallback to type-based generator
+        return provider()
+    
+    def bind(self, col_name: str, col_type: str) -> Optional[Callable[[int], Any]]:
+        provider = self._resolve_provider(col_name)
+        if provider is None:
+            return None  # Fallback to type-based generator
+        return lambda record_num: provider()
+    
+    def bind_batch(self, col_name: str, col_type: str) -> Optional[Callable[..., List[Any]]]:
+        rule_index = self._match_rule(col_name)
+        if rule_index is None:
+            return None  # Fallback to type-based generator
         
-        return None  # Fallback to type-based generator
+        provider = _SMART_RULES[rule_index][2](self.faker)
+        if not _SMART_RULES[rule_index][3]:
+            return lambda num_records, start=0: [provider() for _ in range(num_records)]
+        return self._pooled_batch(rule_index, provider)
+    
+    def _match_rule(self, col_name: str) -> Optional[int]:
+        """Return the index of the first matching rule, or None if no keyword applies."""
+        return _match_smart_rule(col_name.lower())
+    
+    def _resolve_provider(self, col_name: str) -> Optional[Callable[[], Any]]:
+        """Pick the Faker provider for a column name, or None if no keyword applies."""
+        rule_index = self._match_rule(col_name)
+        if rule_index is None:
+            return None
+        return _SMART_RULES[rule_index][2](self.faker)
 
 
 class IntegerFieldGenerator(FieldGenerator):
     """Generator for integer types."""
     
-    def can_handle(self, col_name: str, col_type: str) -> bool:
-        base_type = re.sub(r'\([^)]*\)', '', col_type.upper()).strip()
-        return base_type in ['INT', 'INTEGER', 'BIGINT', 'SMALLINT', 'TINYINT', 'MEDIUMINT']
+    base_types = frozenset(['INT', 'INTEGER', 'BIGINT', 'SMALLINT', 'TINYINT', 'MEDIUMINT'])
     
     def generate(
         self, 
@@ -140,14 +289,27 @@ class IntegerFieldGenerator(FieldGenerator):
         if 'unsigned' in col_type.upper():
             return self.faker.random_int(min=0, max=2147483647)
         return self.faker.random_int(min=-2147483648, max=2147483647)
+    
+    def bind(self, col_name: str, col_type: str) -> Optional[Callable[[int], Any]]:
+        random_int = self.faker.random_int
+        low = 0 if 'unsigned' in col_type.upper() else -2147483648
+        return lambda record_num: random_int(min=low, max=2147483647)
+    
+    def bind_batch(self, col_name: str, col_type: str) -> Optional[Callable[..., List[Any]]]:
+        # Both ranges span a power of two, so raw random bits map onto them
+        # exactly and skip randint's rejection-sampling overhead
+        getrandbits = self.faker.random.getrandbits
+        if 'unsigned' in col_type.upper():
+            return lambda num_records, start=0: [getrandbits(31) for _ in range(num_records)]
+        return lambda num_records, start=0: [
+            getrandbits(32) - 2147483648 for _ in range(num_records)
+        ]
 
 
 class DecimalFieldGenerator(FieldGenerator):
     """Generator for decimal/numeric types."""
     
-    def can_handle(self, col_name: str, col_type: str) -> bool:
-        base_type = re.sub(r'\([^)]*\)', '', col_type.upper()).strip()
-        return base_type in ['DECIMAL', 'NUMERIC', 'FLOAT', 'DOUBLE', 'REAL']
+    base_types = frozenset(['DECIMAL', 'NUMERIC', 'FLOAT', 'DOUBLE', 'REAL'])
     
     def generate(
         self, 
@@ -157,20 +319,52 @@ class DecimalFieldGenerator(FieldGenerator):
         record_num: int = 0,
         **kwargs
     ) -> Any:
-        length_match = re.search(r'\((\d+)\)', col_type.upper())
-        max_length = int(length_match.group(1)) if length_match else None
+        return self.bind(col_name, col_type)(record_num)
+    
+    def bind(self, col_name: str, col_type: str) -> Optional[Callable[[int], Any]]:
+        uniform = self.faker.random.uniform
+        left_digits, right_digits = self._digits(col_type)
+        # Largest magnitude that still fits once rounded to right_digits
+        bound = 10 ** left_digits - 10 ** -right_digits
+        if right_digits == 0:
+            return lambda record_num: round(uniform(-bound, bound))
+        return lambda record_num: round(uniform(-bound, bound), right_digits)
+    
+    def bind_batch(self, col_name: str, col_type: str) -> Optional[Callable[..., List[Any]]]:
+        uniform = self.faker.random.uniform
+        left_digits, right_digits = self._digits(col_type)
+        bound = 10 ** left_digits - 10 ** -right_digits
+        if right_digits == 0:
+            return lambda num_records, start=0: [
+                round(uniform(-bound, bound)) for _ in range(num_records)
+            ]
+        return lambda num_records, start=0: [
+            round(uniform(-bound, bound), right_digits) for _ in range(num_records)
+        ]
+    
+    @staticmethod
+    def _digits(col_type: str) -> Tuple[int, int]:
+        """
+        Integer and fractional digit counts for a numeric column type.
+        
+        DECIMAL(p,s) has p-s integer and s fractional digits; a single length
+        keeps two of its digits for the fraction; no length means 10 and 2.
+        """
+        precision_scale = _PRECISION_SCALE_RE.search(col_type)
+        if precision_scale:
+            precision, scale = map(int, precision_scale.groups())
+            return max(precision - scale, 0), scale
         
+        _, max_length = _parse_type(col_type)
         if max_length:
-            return round(self.faker.pyfloat(left_digits=max_length-2, right_digits=2), 2)
-        return self.faker.pyfloat(left_digits=10, right_digits=2)
+            return max(max_length - 2, 0), 2
+        return 10, 2
 
 
 class StringFieldGenerator(FieldGenerator):
     """Generator for string types (VARCHAR, CHAR, TEXT)."""
     
-    def can_handle(self, col_name: str, col_type: str) -> bool:
-        base_type = re.sub(r'\([^)]*\)', '', col_type.upper()).strip()
-        return base_type in ['VARCHAR', 'CHAR', 'TEXT', 'TINYTEXT', 'MEDIUMTEXT', 'LONGTEXT']
+    base_types = frozenset(['VARCHAR', 'CHAR', 'TEXT', 'TINYTEXT', 'MEDIUMTEXT', 'LONGTEXT'])
     
     def generate(
         self, 
@@ -180,9 +374,7 @@ class StringFieldGenerator(FieldGenerator):
         record_num: int = 0,
         **kwargs
     ) -> Any:
-        base_type = re.sub(r'\([^)]*\)', '', col_type.upper()).strip()
-        length_match = re.search(r'\((\d+)\)', col_type.upper())
-        max_length = int(length_match.group(1)) if length_match else None
+        base_type, max_length = _parse_type(col_type)
         
         if base_type in ['VARCHAR', 'CHAR']:
             if max_length:
@@ -195,14 +387,39 @@ class StringFieldGenerator(FieldGenerator):
             return self.faker.text(max_nb_chars=50).strip()
         else:  # TEXT types
             return self.faker.text(max_nb_chars=500)
+    
+    def bind(self, col_name: str, col_type: str) -> Optional[Callable[[int], Any]]:
+        word, text = self.faker.word, self.faker.text
+        base_type, max_length = _parse_type(col_type)
+        
+        if base_type in ['VARCHAR', 'CHAR']:
+            if max_length and max_length <= 10:
+                return lambda record_num: word()[:max_length]
+            nb_chars = max_length or 50
+            return lambda record_num: text(max_nb_chars=nb_chars).strip()
+        # TEXT types
+        return lambda record_num: text(max_nb_chars=500)
+    
+    def bind_batch(self, col_name: str, col_type: str) -> Optional[Callable[..., List[Any]]]:
+        base_type, max_length = _parse_type(col_type)
+        
+        if base_type in ['VARCHAR', 'CHAR'] and max_length and max_length <= 10:
+            # faker.word() is a uniform pick from the locale's word list, so
+            # sampling the (pre-truncated) list directly is equivalent
+            words = [word[:max_length] for word in self.faker.get_words_list()]
+            choices = self.faker.random.choices
+            return lambda num_records, start=0: choices(words, k=num_records)
+        
+        # Longer strings are only pooled when GeneratorConfig.pool_strings is
+        # set (the factory passes pool_size=None otherwise)
+        value_fn = self.bind(col_name, col_type)
+        return self._pooled_batch((base_type, max_length), lambda: value_fn(0))
 
 
 class DateTimeFieldGenerator(FieldGenerator):
     """Generator for date/time types."""
     
-    def can_handle(self, col_name: str, col_type: str) -> bool:
-        base_type = re.sub(r'\([^)]*\)', '', col_type.upper()).strip()
-        return base_type in ['DATE', 'DATETIME', 'TIMESTAMP', 'TIME', 'YEAR']
+    base_types = frozenset(['DATE', 'DATETIME', 'TIMESTAMP', 'TIME', 'YEAR'])
     
     def generate(
         self, 
@@ -212,7 +429,7 @@ class DateTimeFieldGenerator(FieldGenerator):
         record_num: int = 0,
         **kwargs
     ) -> Any:
-        base_type = re.sub(r'\([^)]*\)', '', col_type.upper()).strip()
+        base_type, _ = _parse_type(col_type)
         
         if base_type == 'DATE':
             return self.faker.date()
@@ -224,14 +441,35 @@ class DateTimeFieldGenerator(FieldGenerator):
             return self.faker.year()
         
         return self.faker.date()
+    
+    def bind(self, col_name: str, col_type: str) -> Optional[Callable[[int], Any]]:
+        faker = self.faker
+        base_type, _ = _parse_type(col_type)
+        
+        if base_type in ['DATETIME', 'TIMESTAMP']:
+            return lambda record_num: faker.date_time_between(start_date='-1y', end_date='now')
+        elif base_type == 'TIME':
+            provider = faker.time
+        elif base_type == 'YEAR':
+            provider = faker.year
+        else:
+            provider = faker.date
+        return lambda record_num: provider()
+    
+    def bind_batch(self, col_name: str, col_type: str) -> Optional[Callable[..., List[Any]]]:
+        if _parse_type(col_type)[0] != 'YEAR':
+            return super().bind_batch(col_name, col_type)
+        
+        # Same range as faker.year(): the epoch up to the current year
+        choices = self.faker.random.choices
+        years = [str(year) for year in range(1970, date.today().year + 1)]
+        return lambda num_records, start=0: choices(years, k=num_records)
 
 
 class BooleanFieldGenerator(FieldGenerator):
     """Generator for boolean types."""
     
-    def can_handle(self, col_name: str, col_type: str) -> bool:
-        base_type = re.sub(r'\([^)]*\)', '', col_type.upper()).strip()
-        return base_type in ['BOOLEAN', 'BOOL', 'BIT']
+    base_types = frozenset(['BOOLEAN', 'BOOL', 'BIT'])
     
     def generate(
         self, 
@@ -241,18 +479,28 @@ class BooleanFieldGenerator(FieldGenerator):
         record_num: int = 0,
         **kwargs
     ) -> Any:
-        base_type = re.sub(r'\([^)]*\)', '', col_type.upper()).strip()
+        base_type, _ = _parse_type(col_type)
         if base_type == 'BIT':
             return self.faker.random_int(min=0, max=1)
         return self.faker.boolean()
+    
+    def bind(self, col_name: str, col_type: str) -> Optional[Callable[[int], Any]]:
+        faker = self.faker
+        base_type, _ = _parse_type(col_type)
+        if base_type == 'BIT':
+            return lambda record_num: faker.random_int(min=0, max=1)
+        return lambda record_num: faker.boolean()
+    
+    def bind_batch(self, col_name: str, col_type: str) -> Optional[Callable[..., List[Any]]]:
+        choices = self.faker.random.choices
+        values = (0, 1) if _parse_type(col_type)[0] == 'BIT' else (False, True)
+        return lambda num_records, start=0: choices(values, k=num_records)
 
 
 class JSONFieldGenerator(FieldGenerator):
     """Generator for JSON types."""
     
-    def can_handle(self, col_name: str, col_type: str) -> bool:
-        base_type = re.sub(r'\([^)]*\)', '', col_type.upper()).strip()
-        return base_type == 'JSON'
+    base_types = frozenset(['JSON'])
     
     def generate(
         self, 
@@ -268,9 +516,7 @@ class JSONFieldGenerator(FieldGenerator):
 class UUIDFieldGenerator(FieldGenerator):
     """Generator for UUID types."""
     
-    def can_handle(self, col_name: str, col_type: str) -> bool:
-        base_type = re.sub(r'\([^)]*\)', '', col_type.upper()).strip()
-        return base_type == 'UUID'
+    base_types = frozenset(['UUID'])
     
     def generate(
         self, 
@@ -281,6 +527,10 @@ class UUIDFieldGenerator(FieldGenerator):
         **kwargs
     ) -> Any:
         return self.faker.uuid4()
+    
+    def bind_batch(self, col_name: str, col_type: str) -> Optional[Callable[..., List[Any]]]:
+        getrandbits = self.faker.random.getrandbits
+        return lambda num_records, start=0: _uuid4_strings(getrandbits, num_records)
 
 
 class DefaultFieldGenerator(FieldGenerator):
@@ -306,18 +556,26 @@ class FieldGeneratorFactory:
     def __init__(self, config: GeneratorConfig):
         self.config = config
         self.faker = config.faker
-        self._generators = [
-            SmartFieldGenerator(self.faker),
-            IntegerFieldGenerator(self.faker),
-            DecimalFieldGenerator(self.faker),
-            StringFieldGenerator(self.faker),
-            DateTimeFieldGenerator(self.faker),
-            BooleanFieldGenerator(self.faker),
-            JSONFieldGenerator(self.faker),
-            UUIDFieldGenerator(self.faker),
-            DefaultFieldGenerator(self.faker),  # Must be last
-        ]
+        self._smart_generator = SmartFieldGenerator(self.faker, pool_size=config.pool_size)
+        self._default_generator = DefaultFieldGenerator(self.faker)
         self._pk_generator = PrimaryKeyGenerator(self.faker)
+        
+        # Base type -> generator, so type dispatch is a single lookup
+        self._by_type = {
+            base_type: generator
+            for generator in (
+                IntegerFieldGenerator(self.faker),
+                DecimalFieldGenerator(self.faker),
+                StringFieldGenerator(
+                    self.faker, pool_size=config.pool_size if config.pool_strings else None
+                ),
+                DateTimeFieldGenerator(self.faker),
+                BooleanFieldGenerator(self.faker),
+                JSONFieldGenerator(self.faker),
+                UUIDFieldGenerator(self.faker),
+            )
+            for base_type in generator.base_types
+        }
     
     def generate_value(
         self,
@@ -338,19 +596,86 @@ class FieldGeneratorFactory:
         Returns:
             Generated value
         """
+        return self.resolve(col_name, col_type, is_primary_key)(record_num)
+    
+    def resolve(
+        self,
+        col_name: str,
+        col_type: str,
+        is_primary_key: bool = False
+    ) -> Callable[[int], Any]:
+        """
+        Resolve the value function for a column.
+        
+        Args:
+            col_name: Column name
+            col_type: SQL column type
+            is_primary_key: Whether this is a primary key
+            
+        Returns:
+            Function mapping a record number to a generated value
+        """
+        return self._select(col_name, col_type, is_primary_key).bind(col_name, col_type)
+    
+    def resolve_batch(
+        self,
+        col_name: str,
+        col_type: str,
+        is_primary_key: bool = False
+    ) -> Callable[..., List[Any]]:
+        """
+        Resolve the whole-column value function for a column.
+        
+        Args:
+            col_name: Column name
+            col_type: SQL column type
+            is_primary_key: Whether this is a primary key
+            
+        Returns:
+            Function mapping (record count, start record) to the generated values
+        """
+        return self._select(col_name, col_type, is_primary_key).bind_batch(col_name, col_type)
+    
+    def compile_plan(
+        self,
+        columns: Dict[str, str],
+        primary_key_col: Optional[str] = None,
+        skip: Optional[set] = None
+    ) -> List[Tuple[str, Callable[..., List[Any]]]]:
+        """
+        Compile the per-column generation plan for a table.
+        
+        Generator dispatch depends only on the column, so it is resolved
+        once per table instead of once per generated value.
+        
+        Args:
+            columns: Mapping of column name to SQL type
+            primary_key_col: Primary key column name, if any
+            skip: Column names handled elsewhere (e.g. foreign keys)
+            
+        Returns:
+            List of (column name, batch function) pairs in column order
+        """
+        skip = skip or set()
+        return [
+            (col_name, self.resolve_batch(col_name, col_type, col_name == primary_key_col))
+            for col_name, col_type in columns.items()
+            if col_name not in skip
+        ]
+    
+    def _select(self, col_name: str, col_type: str, is_primary_key: bool) -> FieldGenerator:
+        """
+        Select the generator strategy for a column.
+        
+        Name-based detection takes precedence; otherwise the generator is
+        looked up by the column's base type, falling back to the default.
+        """
         # Handle primary keys separately
         if is_primary_key:
-            return self._pk_generator.generate(
-                col_name, col_type, is_primary_key=True, record_num=record_num
-            )
+            return self._pk_generator
         
-        # Try each generator in order
-        for generator in self._generators:
-            if generator.can_handle(col_name, col_type):
-                return generator.generate(
-                    col_name, col_type, is_primary_key=False, record_num=record_num
-                )
+        # Detect from the column name first (e.g. email, phone)
+        if self._smart_generator.can_handle(col_name, col_type):
+            return self._smart_generator
         
-        # Fallback (should never reach here due to DefaultFieldGenerator)
-        return self.faker.word()
-
+        return self._by_type.get(_parse_type(col_type)[0], self._default_generator)
@@ -0,0 +1,87 @@
+"""
+Columnar container for generated table data.
+"""
+
+from functools import lru_cache
+from itertools import repeat
+from typing import Any, Callable, Dict, Iterator, List, Optional, Sequence, Tuple
+
+
+@lru_cache(maxsize=128)
+def _row_builder(col_names: Tuple[str, ...]) -> Callable[..., Dict[str, Any]]:
+    """
+    Compile a function building a row dictionary from one value per column.
+    
+    For columns ('id', 'email') this is equivalent to
+    ``def build(c0, c1): return {'id': c0, 'email': c1}``; a dict literal with
+    fixed keys is cheaper than dict(zip(names, row)), and the function can
+    be mapped over the column lists directly without building row tuples.
+    """
+    params = ', '.join(f'c{index}' for index in range(len(col_names)))
+    items = ', '.join(f'{name!r}: c{index}' for index, name in enumerate(col_names))
+    namespace: Dict[str, Any] = {}
+    exec(f'def build({params}):\n    return {{{items}}}\n', namespace)
+    return namespace['build']
+
+
+class TableData:
+    """
+    Generated records of a single table, stored column by column.
+    
+    Iterating yields row dictionaries lazily, so consumers that stream rows
+    (e.g. the SQL exporter) never hold every row dictionary at once.
+    """
+    
+    __slots__ = ('columns', 'num_records')
+    
+    def __init__(self, columns: Dict[str, List[Any]], num_records: int):
+        """
+        Initialize table data.
+        
+        Args:
+            columns: Mapping of column name to its list of values
+            num_records: Number of records (length of every column list)
+        """
+        self.columns = columns
+        self.num_records = num_records
+    
+    def __len__(self) -> int:
+        return self.num_records
+    
+    def __iter__(self) -> Iterator[Dict[str, Any]]:
+        if not self.columns:
+            return (dict() for _ in range(self.num_records))
+        
+        build = _row_builder(tuple(self.columns))
+        return map(build, *self.columns.values())
+    
+    def rows(self, columns: Optional[Sequence[str]] = None) -> Iterator[Tuple[Any, ...]]:
+        """
+        Iterate over records as tuples.
+        
+        Args:
+            columns: Column order of the tuples (defaults to the stored order);
+                     columns without values are filled with None
+            
+        Returns:
+            Iterator of value tuples, one per record
+        """
+        if columns is None:
+            columns = list(self.columns)
+        if not columns:
+            return repeat((), self.num_records)
+        
+        return zip(*(
+            self.columns.get(col_name) or repeat(None, self.num_records)
+            for col_name in columns
+        ))
+    
+    def to_records(self) -> List[Dict[str, Any]]:
+        """Materialize the records as a list of row dictionaries."""
+        return list(self)
+    
+    def extend(self, other: 'TableData') -> None:
+        """Append the records of another shard of the same table."""
+        for col_name, values in other.columns.items():
+            self.columns.setdefault(col_name, []).extend(values)
+        self.num_records += other.num_records
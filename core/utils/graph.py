@@ -6,7 +6,10 @@ Please use core.utils.graph.dependency_graph.DependencyGraph instead.
 """
 
 from typing import Dict, Any
-from core.utils.graph.dependency_graph import get_insertion_order as _get_insertion_order
+from core.utils.graph.dependency_graph import (
+    get_insertion_layers as _get_insertion_layers,
+    get_insertion_order as _get_insertion_order,
+)
 
 
 def get_insertion_order(tables: Dict[str, Dict[str, Any]]) -> list[str]:
@@ -26,3 +29,23 @@ def get_insertion_order(tables: Dict[str, Dict[str, Any]]) -> list[str]:
         CircularDependencyError: If a circular dependency is detected.
     """
     return _get_insertion_order(tables)
+
+
+def get_insertion_layers(tables: Dict[str, Dict[str, Any]]) -> list[list[str]]:
+    """
+    Build a dependency graph from table foreign keys and return insertion layers.
+    
+    DEPRECATED: This is a backward compatibility wrapper.
+    Please use DependencyGraph class from core.utils.graph.dependency_graph instead.
+    
+    Args:
+        tables: Dictionary mapping table names to their schema info.
+    
+    Returns:
+        List of layers (lists of table names) whose tables are independent of
+        each other, dependencies first.
+        
+    Raises:
+        CircularDependencyError: If a circular dependency is detected.
+    """
+    return _get_insertion_layers(tables)
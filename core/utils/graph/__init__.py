@@ -2,7 +2,12 @@
 Dependency graph package for determining safe table insertion order.
 """
 
-from core.utils.graph.dependency_graph import DependencyGraph, get_insertion_order
+from core.utils.graph.dependency_graph import (
+    DependencyGraph,
+    clear_order_cache,
+    get_insertion_layers,
+    get_insertion_order,
+)
 
-__all__ = ['DependencyGraph', 'get_insertion_order']
+__all__ = ['DependencyGraph', 'clear_order_cache', 'get_insertion_layers', 'get_insertion_order']
 
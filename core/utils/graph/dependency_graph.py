@@ -1,14 +1,14 @@
 """
 Dependency graph builder for determining safe table insertion order.
 
-This module uses NetworkX to build a directed graph of table dependencies
-based on foreign key relationships and computes a topological sort to
+This module builds a directed graph of table dependencies based on foreign
+key relationships and computes a topological sort (Kahn's algorithm) to
 determine the correct insertion order that respects all foreign key constraints.
 """
 
-import networkx as nx
-from networkx import NetworkXUnfeasible
-from typing import Dict, Any, List, Set
+import threading
+from collections import deque
+from typing import Dict, Any, FrozenSet, List, Optional, Set, Tuple
 
 from core.exceptions import CircularDependencyError
 
@@ -17,14 +17,17 @@ class DependencyGraph:
     """
     Builds and manages dependency graph for SQL table insertion order.
     
-    Uses NetworkX to build a directed graph of table dependencies based on
-    foreign key relationships and computes topological sort for safe insertion order.
+    Builds a directed graph of table dependencies based on foreign key
+    relationships and computes topological sort for safe insertion order.
     """
     
     def __init__(self, tables: Dict[str, Dict[str, Any]]):
         """
         Initialize dependency graph from table schema.
         
+        The tables are treated as immutable: sort and cycle results are
+        computed once and cached, so mutating them afterwards is unsupported.
+        
         Args:
             tables: Dictionary mapping table names to their schema info.
                     Expected format:
@@ -42,36 +45,47 @@ class DependencyGraph:
                     }
         """
         self.tables = tables
-        self.graph = self._build_graph()
+        self._build_graph()
+        # Cached results of _topological_sort() and _cyclic_components()
+        self._sorted: Optional[Tuple[List[str], Dict[str, int]]] = None
+        self._components: Optional[List[List[str]]] = None
     
-    def _build_graph(self) -> nx.DiGraph:
+    def _build_graph(self) -> None:
         """
         Build directed graph from foreign key relationships.
         
-        Returns:
-            NetworkX DiGraph with tables as nodes and dependencies as edges
+        The graph is kept as plain adjacency dicts with tables as nodes and
+        dependencies as edges.
         """
-        graph = nx.DiGraph()
-        
-        # Add all tables as nodes
-        for table_name in self.tables.keys():
-            graph.add_node(table_name)
+        tables = self.tables
+        # Plain adjacency: dependents and dependencies of each table (dicts
+        # used as ordered sets, so repeated FKs add one edge), plus the number
+        # of distinct tables each table depends on for the topological sort
+        successors = self._successors = {table_name: {} for table_name in tables}
+        predecessors = self._predecessors = {table_name: {} for table_name in tables}
+        in_degree = self._in_degree = dict.fromkeys(tables, 0)
+        self._num_edges = 0
         
         # Add edges for foreign key dependencies
         # Edge direction: ref_table → dependent_table
         # (the referenced table must come before the table with the foreign key)
-        for table_name, table_info in self.tables.items():
-            foreign_keys = table_info.get("foreign_keys", {})
+        for table_name, table_info in tables.items():
+            foreign_keys = table_info.get("foreign_keys")
+            if not foreign_keys:
+                continue
             
-            for local_col, fk_info in foreign_keys.items():
+            dependencies = predecessors[table_name]
+            for fk_info in foreign_keys.values():
                 ref_table = fk_info.get("ref_table")
                 
-                if ref_table and ref_table in self.tables:
+                if ref_table and ref_table in tables:
                     # Add edge: ref_table → table_name
                     # This means ref_table must be inserted before table_name
-                    graph.add_edge(ref_table, table_name)
-        
-        return graph
+                    if ref_table not in dependencies:
+                        successors[ref_table][table_name] = None
+                        dependencies[ref_table] = None
+                        in_degree[table_name] += 1
+                        self._num_edges += 1
     
     def get_insertion_order(self) -> List[str]:
         """
@@ -83,24 +97,89 @@ class DependencyGraph:
         Raises:
             CircularDependencyError: If a circular dependency is detected.
         """
-        try:
-            order = list(nx.topological_sort(self.graph))
-            return order
-        except NetworkXUnfeasible:
-            # Cycle detected - find and report the cycle
-            cycles = list(nx.simple_cycles(self.graph))
-            if cycles:
-                # Get all tables involved in cycles
-                involved_tables = set()
-                for cycle in cycles:
-                    involved_tables.update(cycle)
-                raise CircularDependencyError(sorted(list(involved_tables)))
-            else:
-                # Fallback if no cycles found but sort still failed
-                raise CircularDependencyError(
-                    list(self.tables.keys()),
-                    "Circular dependency detected in table foreign keys"
-                )
+        order, _ = self._topological_sort()
+        if len(order) != len(self.tables):
+            self._raise_cycle_error()
+        return list(order)
+    
+    def get_insertion_layers(self) -> List[List[str]]:
+        """
+        Group tables into insertion layers.
+        
+        Every table's dependencies are in earlier layers, so the tables within
+        a layer are independent of each other and can be processed concurrently.
+        
+        Returns:
+            List of layers (lists of table names), dependencies first.
+            
+        Raises:
+            CircularDependencyError: If a circular dependency is detected.
+        """
+        order, levels = self._topological_sort()
+        if len(order) != len(self.tables):
+            self._raise_cycle_error()
+        
+        layers = []
+        for table_name in order:
+            level = levels[table_name]
+            if level == len(layers):
+                layers.append([])
+            layers[level].append(table_name)
+        return layers
+    
+    def _topological_sort(self) -> Tuple[List[str], Dict[str, int]]:
+        """
+        Run Kahn's algorithm over the foreign key graph.
+        
+        Tables are dequeued in FIFO order, so they come out grouped by layer:
+        a table's layer is one more than that of its last-sorted dependency.
+        
+        Returns:
+            Tuple of (sorted table names, layer index per sorted table). Tables
+            that are part of or depend on a cycle are missing from both.
+        """
+        if self._sorted is not None:
+            return self._sorted
+        
+        if not self._num_edges:
+            # No dependencies: schema order is already a valid order
+            order = list(self.tables)
+            self._sorted = (order, dict.fromkeys(order, 0))
+            return self._sorted
+        
+        in_degree = dict(self._in_degree)
+        successors = self._successors
+        queue = deque(table_name for table_name, degree in in_degree.items() if degree == 0)
+        levels = dict.fromkeys(queue, 0)
+        order = []
+        
+        while queue:
+            table_name = queue.popleft()
+            order.append(table_name)
+            for dependent in successors[table_name]:
+                in_degree[dependent] -= 1
+                if in_degree[dependent] == 0:
+                    levels[dependent] = levels[table_name] + 1
+                    queue.append(dependent)
+        
+        self._sorted = (order, levels)
+        return self._sorted
+    
+    def _raise_cycle_error(self) -> None:
+        """Raise CircularDependencyError listing the tables involved in cycles."""
+        # Cycle detected - every table in a cyclic component is on some cycle
+        components = self._cyclic_components()
+        if components:
+            involved_tables = set()
+            for component in components:
+                involved_tables.update(component)
+            raise CircularDependencyError(sorted(list(involved_tables)))
+        else:
+            # Fallback if no cycles found but sort still failed
+            raise CircularDependencyError(
+                list(self.tables.keys()),
+                "Circular dependency detected in table foreign keys"
+            )
     
     def has_cycles(self) -> bool:
         """
@@ -109,12 +188,9 @@ class DependencyGraph:
         Returns:
             True if cycles exist, False otherwise
         """
-        try:
-            # Try topological sort - if it fails, there's a cycle
-            list(nx.topological_sort(self.graph))
-            return False
-        except NetworkXUnfeasible:
-            return True
+        # The sort leaves out every table on (or behind) a cycle
+        order, _ = self._topological_sort()
+        return len(order) != len(self.tables)
     
     def get_dependencies(self, table_name: str) -> List[str]:
         """
@@ -126,11 +202,8 @@ class DependencyGraph:
         Returns:
             List of table names that must be inserted before this table
         """
-        if table_name not in self.graph:
-            return []
-        
         # Get all predecessors (tables this table depends on)
-        return list(self.graph.predecessors(table_name))
+        return list(self._predecessors.get(table_name, ()))
     
     def get_dependents(self, table_name: str) -> List[str]:
         """
@@ -142,23 +215,127 @@ class DependencyGraph:
         Returns:
             List of table names that depend on this table
         """
-        if table_name not in self.graph:
-            return []
-        
         # Get all successors (tables that depend on this table)
-        return list(self.graph.successors(table_name))
+        return list(self._successors.get(table_name, ()))
     
     def get_cycles(self) -> List[List[str]]:
         """
-        Get all cycles in the dependency graph.
+        Get the cycles in the dependency graph.
+        
+        One cycle is reported per group of mutually dependent tables (the
+        shortest cycle through one of its tables), rather than enumerating
+        every elementary cycle, which can be exponential.
         
         Returns:
             List of cycles, where each cycle is a list of table names
         """
-        try:
-            return list(nx.simple_cycles(self.graph))
-        except Exception:
-            return []
+        return [
+            self._cycle_through(min(component), set(component))
+            for component in self._cyclic_components()
+        ]
+    
+    def _cyclic_components(self) -> List[List[str]]:
+        """
+        Find the strongly connected components that contain a cycle.
+        
+        Iterative Tarjan's algorithm (an explicit stack instead of recursion,
+        so deep FK chains cannot hit the recursion limit), O(V+E). Components
+        of one table only count if the table references itself.
+        
+        Returns:
+            List of cyclic components, each a list of table names
+        """
+        if self._components is not None:
+            return self._components
+        
+        successors = self._successors
+        index: Dict[str, int] = {}
+        lowlink: Dict[str, int] = {}
+        stack: List[str] = []
+        on_stack: Set[str] = set()
+        components = []
+        
+        for root in successors:
+            if root in index:
+                continue
+            
+            index[root] = lowlink[root] = len(index)
+            stack.append(root)
+            on_stack.add(root)
+            work = [(root, iter(successors[root]))]
+            
+            while work:
+                table_name, dependents = work[-1]
+                for dependent in dependents:
+                    if dependent not in index:
+                        # Descend into the dependent; resume this table later
+                        index[dependent] = lowlink[dependent] = len(index)
+                        stack.append(dependent)
+                        on_stack.add(dependent)
+                        work.append((dependent, iter(successors[dependent])))
+                        break
+                    if dependent in on_stack:
+                        lowlink[table_name] = min(lowlink[table_name], index[dependent])
+                else:
+                    # All dependents visited
+                    work.pop()
+                    if work:
+                        parent = work[-1][0]
+                        lowlink[parent] = min(lowlink[parent], lowlink[table_name])
+                    
+                    if lowlink[table_name] == index[table_name]:
+                        # table_name is the root of a component: pop it
+                        component = []
+                        while True:
+                            member = stack.pop()
+                            on_stack.discard(member)
+                            component.append(member)
+                            if member == table_name:
+                                break
+                        if len(component) > 1 or table_name in successors[table_name]:
+                            components.append(component)
+        
+        self._components = components
+        return components
+    
+    def _cycle_through(self, start: str, component: Set[str]) -> List[str]:
+        """
+        Find the shortest cycle through a table within its component.
+        
+        Args:
+            start: Table to start from
+            component: Tables of the cyclic component containing start
+            
+        Returns:
+            Table names along the cycle, beginning with start
+        """
+        parents = {start: None}
+        queue = deque([start])
+        while queue:
+            table_name = queue.popleft()
+            for dependent in self._successors[table_name]:
+                if dependent == start:
+                    cycle = []
+                    while table_name is not None:
+                        cycle.append(table_name)
+                        table_name = parents[table_name]
+                    return cycle[::-1]
+                if dependent in component and dependent not in parents:
+                    parents[dependent] = table_name
+                    queue.append(dependent)
+        
+        return [start]
+
+
+# Maximum number of sort results kept by get_insertion_order/get_insertion_layers
+ORDER_CACHE_SIZE = 128
+# (insertion order, insertion layers) keyed by the schema's table names and
+# foreign key edges; only table names are kept, never the schema itself
+_order_cache: Dict[
+    Tuple[Tuple[str, ...], FrozenSet[Tuple[str, str]]],
+    Tuple[Tuple[str, ...], Tuple[Tuple[str, ...], ...]]
+] = {}
+_order_cache_lock = threading.Lock()
 
 
 # Backward compatibility: keep the old function interface
@@ -167,6 +344,8 @@ def get_insertion_order(tables: Dict[str, Dict[str, Any]]) -> List[str]:
     Build a dependency graph from table foreign keys and return insertion order.
     
     This is a backward compatibility wrapper around DependencyGraph class.
+    Results are cached by table order and foreign key edges, so sorting an
+    equal schema again is a lookup.
     
     Args:
         tables: Dictionary mapping table names to their schema info.
@@ -177,6 +356,77 @@ def get_insertion_order(tables: Dict[str, Dict[str, Any]]) -> List[str]:
     Raises:
         CircularDependencyError: If a circular dependency is detected.
     """
-    graph = DependencyGraph(tables)
-    return graph.get_insertion_order()
+    if not _has_foreign_keys(tables):
+        return list(tables)
+    
+    return list(_cached_sort(tables)[0])
+
 
+def get_insertion_layers(tables: Dict[str, Dict[str, Any]]) -> List[List[str]]:
+    """
+    Build a dependency graph from table foreign keys and return insertion layers.
+    
+    Tables within a layer do not depend on each other, so each layer can be
+    processed in parallel once all previous layers are done.
+    
+    Args:
+        tables: Dictionary mapping table names to their schema info.
+        
+    Returns:
+        List of layers (lists of table names), dependencies first.
+        
+    Raises:
+        CircularDependencyError: If a circular dependency is detected.
+    """
+    if not _has_foreign_keys(tables):
+        return [list(tables)] if tables else []
+    
+    return [list(layer) for layer in _cached_sort(tables)[1]]
+
+
+def _has_foreign_keys(tables: Dict[str, Dict[str, Any]]) -> bool:
+    """Check whether any table declares a foreign key (else no graph is needed)."""
+    return any(table_info.get("foreign_keys") for table_info in tables.values())
+
+
+def clear_order_cache() -> None:
+    """Forget all sort results cached by get_insertion_order/get_insertion_layers."""
+    with _order_cache_lock:
+        _order_cache.clear()
+
+
+def _cached_sort(
+    tables: Dict[str, Dict[str, Any]]
+) -> Tuple[Tuple[str, ...], Tuple[Tuple[str, ...], ...]]:
+    """
+    Get the insertion order and layers of the tables, reusing those of an equal schema.
+    
+    The sort only depends on the table order and the foreign key edges, so
+    those form the cache key. Schemas with cycles are not cached; building
+    their graph raises CircularDependencyError every time.
+    
+    Returns:
+        Tuple of (insertion order, insertion layers)
+    """
+    key = (tuple(tables), frozenset(
+        (table_name, fk_info.get("ref_table"))
+        for table_name, table_info in tables.items()
+        for fk_info in (table_info.get("foreign_keys") or {}).values()
+    ))
+    with _order_cache_lock:
+        cached = _order_cache.get(key)
+    if cached is not None:
+        return cached
+    
+    graph = DependencyGraph(tables)
+    cached = (
+        tuple(graph.get_insertion_order()),
+        tuple(map(tuple, graph.get_insertion_layers()))
+    )
+    
+    with _order_cache_lock:
+        # Evict the oldest entry once the cache is full
+        if len(_order_cache) >= ORDER_CACHE_SIZE:
+            _order_cache.pop(next(iter(_order_cache), None), None)
+        _order_cache[key] = cached
+    return cached
@@ -7,31 +7,87 @@ Parses CREATE TABLE statements to extract table structure including:
 - Foreign keys
 """
 
-import sqlparse
+import hashlib
 import logging
 import re
-from typing import Dict, Any, Optional, Tuple, List
+import sys
+import threading
+from typing import Dict, Any, Iterator, Optional, Tuple, List
 
 from core.exceptions import SchemaParsingError
 
-# Set up logging
-logging.basicConfig(level=logging.ERROR)
+# Module logger; logging configuration is left to the application
+logger = logging.getLogger(__name__)
 
 # Valid SQL data types (case-insensitive)
-VALID_SQL_TYPES = {
+VALID_SQL_TYPES = frozenset({
     'INT', 'INTEGER', 'TINYINT', 'SMALLINT', 'MEDIUMINT', 'BIGINT',
     'DECIMAL', 'NUMERIC', 'FLOAT', 'DOUBLE', 'REAL',
     'CHAR', 'VARCHAR', 'TEXT', 'TINYTEXT', 'MEDIUMTEXT', 'LONGTEXT',
     'BINARY', 'VARBINARY', 'BLOB', 'TINYBLOB', 'MEDIUMBLOB', 'LONGBLOB',
     'DATE', 'TIME', 'DATETIME', 'TIMESTAMP', 'YEAR',
     'BOOLEAN', 'BOOL', 'BIT', 'JSON', 'UUID'
-}
+})
+
+# Identifiers and types are interned as they are extracted: table names
+# recur as FK targets across the schema and are used as dict keys by the
+# dependency graph and the generators, so equal names share one object.
+
+# Patterns compiled once at import; they run for every statement and column
+_CREATE_TABLE_RE = re.compile(r'^\s*CREATE\s+TABLE\s+', re.IGNORECASE)
+_TABLE_NAME_RE = re.compile(r'CREATE\s+TABLE\s+[`"]?(\w+)[`"]?', re.IGNORECASE)
+_TABLE_BODY_RE = re.compile(r'CREATE\s+TABLE\s+[^(]+\(([\s\S]*)\)', re.IGNORECASE)
+_LOOKS_LIKE_COLUMN_RE = re.compile(r'^[`"]?\w+[`"]?\s+[A-Za-z]+', re.IGNORECASE)
+_INLINE_PK_RE = re.compile(r'\bPRIMARY\s+KEY\b', re.IGNORECASE)
+_COLUMN_RE = re.compile(r'^[`"]?(\w+)[`"]?\s+([A-Za-z]+)(?:\s*(\([^)]*\)))?', re.IGNORECASE)
+# PRIMARY KEY (column_name), or PRIMARY KEY column_name (less common)
+_PK_RE = re.compile(
+    r'PRIMARY\s+KEY(?:\s*\([`"]?(\w+)[`"]?\)|\s+[`"]?(\w+)[`"]?)',
+    re.IGNORECASE
+)
+_FK_RE = re.compile(
+    r'FOREIGN\s+KEY\s*\([`"]?(\w+)[`"]?\)\s+REFERENCES\s+[`"]?(\w+)[`"]?\s*\([`"]?(\w+)[`"]?\)',
+    re.IGNORECASE
+)
+_INLINE_FK_RE = re.compile(
+    r'^[`"]?(\w+)[`"]?\s+REFERENCES\s+[`"]?(\w+)[`"]?\s*\([`"]?(\w+)[`"]?\)',
+    re.IGNORECASE
+)
+_LEADING_WORD_RE = re.compile(r'\w+')
+# Statement separators and comments, plus quoted strings/identifiers so that
+# separators and comment markers inside them are skipped over
+_STATEMENT_TOKEN_RE = re.compile(
+    r"(?P<end>;)"
+    r"|(?P<comment>--[^\n]*|#[^\n]*|/\*.*?\*/)"
+    r"|'[^'\\]*(?:(?:\\.|'')[^'\\]*)*'"
+    r'|"[^"\\]*(?:(?:\\.|"")[^"\\]*)*"'
+    r"|`[^`]*`",
+    re.DOTALL
+)
+
+# First words of table constraints / index definitions
+_CONSTRAINT_KEYWORDS = frozenset({
+    'CONSTRAINT', 'KEY', 'UNIQUE', 'INDEX', 'CHECK', 'FULLTEXT', 'SPATIAL'
+})
+# First words that only start a constraint when followed by KEY
+_KEY_CONSTRAINT_KEYWORDS = frozenset({'PRIMARY', 'FOREIGN'})
+
+# Maximum number of parsed schemas kept by parse_sql_schema
+SCHEMA_CACHE_SIZE = 64
+# Parsed schemas keyed by a digest of the SQL content
+_schema_cache: Dict[bytes, Dict[str, Dict[str, Any]]] = {}
+_schema_cache_lock = threading.Lock()
 
 
 def parse_sql_schema(sql_content: str) -> Dict[str, Dict[str, Any]]:
     """
     Parse SQL schema content and extract tables, columns, primary keys, and foreign keys.
     
+    Results are cached by a digest of the content, so parsing the same schema
+    again (e.g. one task per upload of the same file) is a hash, a lookup and
+    a copy. Every call returns its own copy, so callers may modify it without
+    affecting later calls.
+    
     Args:
         sql_content: String containing SQL CREATE TABLE statements
         
@@ -45,17 +101,57 @@ def parse_sql_schema(sql_content: str) -> Dict[str, Dict[str, Any]]:
             }
         }
     """
+    digest = hashlib.blake2b(sql_content.encode('utf-8'), digest_size=16).digest()
+    with _schema_cache_lock:
+        cached = _schema_cache.get(digest)
+    if cached is not None:
+        return _copy_schema(cached)
+    
+    result = _parse_sql_schema(sql_content)
+    cached = _copy_schema(result)
+    
+    with _schema_cache_lock:
+        # Evict the oldest entry once the cache is full
+        if len(_schema_cache) >= SCHEMA_CACHE_SIZE:
+            _schema_cache.pop(next(iter(_schema_cache), None), None)
+        _schema_cache[digest] = cached
+    return result
+
+
+def _copy_schema(schema: Dict[str, Dict[str, Any]]) -> Dict[str, Dict[str, Any]]:
+    """
+    Copy a parsed schema down to its innermost dicts.
+    
+    The leaves are strings (or None), so this is a full copy of the known
+    structure at a fraction of the cost of copy.deepcopy() or a re-parse.
+    """
+    return {
+        table_name: {
+            'columns': dict(table_info['columns']),
+            'primary_key': table_info['primary_key'],
+            'foreign_keys': {
+                col_name: dict(fk_info) for col_name, fk_info in table_info['foreign_keys'].items()
+            }
+        }
+        for table_name, table_info in schema.items()
+    }
+
+
+def clear_schema_cache() -> None:
+    """Forget all parsed schemas cached by parse_sql_schema."""
+    with _schema_cache_lock:
+        _schema_cache.clear()
+
+
+def _parse_sql_schema(sql_content: str) -> Dict[str, Dict[str, Any]]:
+    """Parse SQL schema content without consulting the cache."""
     result = {}
 
     try:
-        # Parse SQL statements
-        statements = sqlparse.parse(sql_content)
-        
-        for statement in statements:
+        for stmt_str in _iter_statements(sql_content):
             try:
-                # Convert to string and check if it's CREATE TABLE
-                stmt_str = str(statement).strip()
-                if not re.match(r'^\s*CREATE\s+TABLE\s+', stmt_str, re.IGNORECASE):
+                # Check if it's CREATE TABLE
+                if not _CREATE_TABLE_RE.match(stmt_str):
                     continue
                 
                 # Extract table name
@@ -74,27 +170,68 @@ def parse_sql_schema(sql_content: str) -> Dict[str, Dict[str, Any]]:
                 _parse_table_definition(stmt_str, result[table_name])
                 
             except (ValueError, IndexError, AttributeError) as e:
-                table_name = _try_get_table_name(str(statement))
-                logging.error("Failed to parse table: %s - Error: %s", table_name, str(e))
+                table_name = _try_get_table_name(stmt_str)
+                logger.error("Failed to parse table: %s - Error: %s", table_name, str(e))
                 continue
                 
     except Exception as e:
-        logging.error("Failed to parse SQL content: %s", str(e))
+        logger.error("Failed to parse SQL content: %s", str(e))
         raise SchemaParsingError(f"Failed to parse SQL content: {str(e)}") from e
     
     return result
 
 
+def _iter_statements(sql_content: str) -> Iterator[str]:
+    """
+    Split SQL content into statement strings lazily.
+    
+    Statements end at semicolons outside of quoted strings, quoted
+    identifiers and comments; comments are replaced by a space. Only those
+    tokens are visited, so large dumps are split without tokenizing every
+    word, and one statement is produced at a time.
+    
+    Args:
+        sql_content: SQL text containing one or more statements
+        
+    Returns:
+        Iterator of stripped, non-empty statements without their semicolons
+    """
+    pieces = []
+    start = 0
+    
+    for match in _STATEMENT_TOKEN_RE.finditer(sql_content):
+        kind = match.lastgroup
+        if kind is None:
+            # Quoted string or identifier: kept as part of the statement
+            continue
+        
+        pieces.append(sql_content[start:match.start()])
+        start = match.end()
+        if kind == 'comment':
+            pieces.append(' ')
+            continue
+        
+        statement = ''.join(pieces).strip()
+        pieces = []
+        if statement:
+            yield statement
+    
+    pieces.append(sql_content[start:])
+    statement = ''.join(pieces).strip()
+    if statement:
+        yield statement
+
+
 def _extract_table_name(statement_str: str) -> Optional[str]:
     """Extract table name from CREATE TABLE statement, handling backticks."""
     try:
         # Match: CREATE TABLE table_name or CREATE TABLE `table_name`
-        match = re.search(r'CREATE\s+TABLE\s+[`"]?(\w+)[`"]?', statement_str, re.IGNORECASE)
+        match = _TABLE_NAME_RE.search(statement_str)
         if match:
-            return match.group(1)
+            return sys.intern(match.group(1))
         return None
     except (ValueError, IndexError, AttributeError) as e:
-        logging.error("Error extracting table name: %s", str(e))
+        logger.error("Error extracting table name: %s", str(e))
         return None
 
 
@@ -110,7 +247,7 @@ def _parse_table_definition(statement_str: str, table_info: Dict[str, Any]) -> N
     """Parse table definition to extract columns, primary keys, and foreign keys."""
     try:
         # Find the content inside parentheses
-        match = re.search(r'CREATE\s+TABLE\s+[^(]+\(([\s\S]*)\)', statement_str, re.IGNORECASE)
+        match = _TABLE_BODY_RE.search(statement_str)
         if not match:
             return
         
@@ -126,20 +263,21 @@ def _parse_table_definition(statement_str: str, table_info: Dict[str, Any]) -> N
             if not part:
                 continue
             
-            part_upper = part.upper().strip()
+            part_upper = part.upper()
             
             # Skip known constraint/keyword patterns BEFORE trying to parse as column
-            if _is_constraint_or_keyword(part_upper):
+            keyword = _constraint_keyword(part_upper)
+            if keyword:
                 # Handle PRIMARY KEY constraint
-                if part_upper.startswith('PRIMARY KEY'):
+                if keyword == 'PRIMARY':
                     pk_column = _extract_primary_key_column(part)
                     if pk_column:
                         table_info['primary_key'] = pk_column
                     continue
                 
                 # Handle FOREIGN KEY (standalone or with CONSTRAINT)
-                if part_upper.startswith('FOREIGN KEY') or \
-                   (part_upper.startswith('CONSTRAINT') and 'FOREIGN KEY' in part_upper) or \
+                if keyword == 'FOREIGN' or \
+                   (keyword == 'CONSTRAINT' and 'FOREIGN KEY' in part_upper) or \
                    ('REFERENCES' in part_upper and not _looks_like_column(part)):
                     fk_info = _extract_foreign_key(part)
                     if fk_info:
@@ -156,44 +294,40 @@ def _parse_table_definition(statement_str: str, table_info: Dict[str, Any]) -> N
             # Try to parse as column definition
             column_info = _extract_column_definition(part)
             if column_info:
-                col_name, col_type, is_primary = column_info
+                col_name, base_type, params, is_primary = column_info
                 # Validate that we got a valid SQL type
-                if _is_valid_sql_type(col_type):
-                    table_info['columns'][col_name] = col_type
+                if base_type in VALID_SQL_TYPES:
+                    # Construct the full type (e.g., VARCHAR(100))
+                    table_info['columns'][col_name] = sys.intern(base_type + params)
                     # Check for inline PRIMARY KEY
                     if is_primary and not table_info['primary_key']:
                         table_info['primary_key'] = col_name
                 else:
-                    logging.error("Invalid SQL type detected: %s in column definition: %s", col_type, part)
+                    logger.error("Invalid SQL type detected: %s in column definition: %s", base_type + params, part)
                     
     except (ValueError, IndexError, AttributeError) as e:
-        logging.error("Error parsing table definition: %s", str(e))
+        logger.error("Error parsing table definition: %s", str(e))
 
 
-def _is_constraint_or_keyword(part_upper: str) -> bool:
+def _constraint_keyword(part_upper: str) -> Optional[str]:
     """
     Check if a part is a constraint or keyword, not a column definition.
     
-    Returns True if the part starts with known constraint keywords.
+    Returns:
+        The leading keyword (e.g. 'PRIMARY', 'CONSTRAINT', 'KEY') if the part
+        is a constraint, so callers can branch on it without re-scanning the
+        part, or None for column definitions
     """
-    constraint_keywords = [
-        'PRIMARY KEY',
-        'FOREIGN KEY',
-        'CONSTRAINT',
-        'KEY',  # Index definition
-        'UNIQUE KEY',
-        'UNIQUE',
-        'INDEX',
-        'CHECK',
-        'FULLTEXT',
-        'SPATIAL',
-    ]
-    
-    for keyword in constraint_keywords:
-        if part_upper.startswith(keyword):
-            return True
+    match = _LEADING_WORD_RE.match(part_upper)
+    if not match:
+        return None
     
-    return False
+    # Compare whole words, so columns such as `keywords` or `index_id`
+    # are not mistaken for KEY / INDEX definitions
+    first_word = match.group()
+    if first_word in _KEY_CONSTRAINT_KEYWORDS:
+        return first_word if part_upper.startswith(' KEY', match.end()) else None
+    return first_word if first_word in _CONSTRAINT_KEYWORDS else None
 
 
 def _looks_like_column(part: str) -> bool:
@@ -204,130 +338,80 @@ def _looks_like_column(part: str) -> bool:
     """
     # Pattern: identifier (with optional backticks) followed by whitespace and a type
     # This is a quick check, full validation happens in _extract_column_definition
-    pattern = r'^[`"]?\w+[`"]?\s+[A-Za-z]+'
-    return bool(re.match(pattern, part, re.IGNORECASE))
+    return bool(_LOOKS_LIKE_COLUMN_RE.match(part))
 
 
 def _smart_split(text: str) -> List[str]:
     """Split text by commas while respecting nested parentheses."""
     parts = []
-    current = ""
+    pending = None
     depth = 0
     
-    i = 0
-    while i < len(text):
-        char = text[i]
-        if char == '(':
-            depth += 1
-            current += char
-        elif char == ')':
-            depth -= 1
-            current += char
-        elif char == ',' and depth == 0:
-            if current.strip():
-                parts.append(current.strip())
-            current = ""
-        else:
-            current += char
-        i += 1
+    # Split on every comma, then glue pieces back together while inside
+    # parentheses; the parentheses are counted per piece by str.count
+    for piece in text.split(','):
+        pending = piece if pending is None else pending + ',' + piece
+        depth += piece.count('(') - piece.count(')')
+        if depth == 0:
+            part = pending.strip()
+            if part:
+                parts.append(part)
+            pending = None
     
-    if current.strip():
-        parts.append(current.strip())
+    if pending is not None:
+        part = pending.strip()
+        if part:
+            parts.append(part)
     
     return parts
 
 
-def _extract_column_definition(part: str) -> Optional[Tuple[str, str, bool]]:
+def _extract_column_definition(part: str) -> Optional[Tuple[str, str, str, bool]]:
     """
     Extract column name and type from a column definition.
     
+    The caller has already ruled out constraints (_constraint_keyword),
+    so the part is matched once and the rest of it is only scanned for an
+    inline PRIMARY KEY.
+    
     Returns:
-        Tuple of (column_name, column_type, is_primary) or None if parsing fails
+        Tuple of (column_name, base_type, params, is_primary) or None if parsing fails,
+        where base_type is e.g. 'VARCHAR' and params e.g. '(100)' or ''
     """
     try:
-        part_clean = part.strip()
-        
-        # Skip if it looks like a constraint
-        part_upper = part_clean.upper()
-        if _is_constraint_or_keyword(part_upper):
-            return None
-        
-        # Check for inline PRIMARY KEY
-        is_primary = bool(re.search(r'\bPRIMARY\s+KEY\b', part_clean, re.IGNORECASE))
-        
         # Pattern: [backtick]column_name[backtick] TYPE[(params)] [modifiers...]
         # More robust regex that requires identifier + valid type pattern
-        match = re.match(
-            r'^[`"]?(\w+)[`"]?\s+([A-Za-z]+(?:\s*\([^)]*\))?)', 
-            part_clean, 
-            re.IGNORECASE
-        )
+        match = _COLUMN_RE.match(part)
         
         if not match:
             return None
         
-        col_name = match.group(1).strip('`').strip('"').strip("'")
-        type_part = match.group(2)
-        
-        # Extract the base type and parameters (e.g., VARCHAR(100))
-        # The type should be a word, optionally followed by parentheses
-        type_match = re.match(r'^([A-Za-z]+)\s*(\([^)]*\))?', type_part, re.IGNORECASE)
-        if not type_match:
-            return None
-        
-        base_type = type_match.group(1).upper()
-        params = type_match.group(2) if type_match.group(2) else ''
+        # (\w+) captures never include quotes or backticks
+        col_name, base_type, params = match.groups('')
+        col_name = sys.intern(col_name)
         
-        # Construct the full type (e.g., VARCHAR(100))
-        col_type = base_type + params
+        # Check for inline PRIMARY KEY among the modifiers after the type
+        is_primary = bool(_INLINE_PK_RE.search(part, match.end()))
         
         # Normalize type (uppercase for consistency)
-        col_type = col_type.upper()
-        
-        return col_name, col_type, is_primary
+        return col_name, base_type.upper(), params.upper(), is_primary
         
     except (ValueError, IndexError, AttributeError) as e:
-        logging.error("Error extracting column definition from '%s': %s", part, str(e))
+        logger.error("Error extracting column definition from '%s': %s", part, str(e))
         return None
 
 
-def _is_valid_sql_type(type_str: str) -> bool:
-    """
-    Validate that a string is a valid SQL data type.
-    
-    Args:
-        type_str: Type string (e.g., 'INT', 'VARCHAR(100)', 'BIGINT')
-    
-    Returns:
-        True if it's a valid SQL type
-    """
-    # Extract base type (remove parentheses and parameters)
-    base_type = re.match(r'^([A-Za-z]+)', type_str, re.IGNORECASE)
-    if not base_type:
-        return False
-    
-    base_type_upper = base_type.group(1).upper()
-    return base_type_upper in VALID_SQL_TYPES
-
-
 def _extract_primary_key_column(part: str) -> Optional[str]:
     """Extract primary key column name from PRIMARY KEY constraint."""
     try:
-        # Match PRIMARY KEY (column_name) - handle backticks
-        match = re.search(r'PRIMARY\s+KEY\s*\([`"]?(\w+)[`"]?\)', part, re.IGNORECASE)
-        if match:
-            col_name = match.group(1)
-            return col_name.strip('`').strip('"').strip("'")
-        
-        # Also try without parentheses (less common)
-        match = re.search(r'PRIMARY\s+KEY\s+[`"]?(\w+)[`"]?', part, re.IGNORECASE)
+        # Match PRIMARY KEY (column_name) or PRIMARY KEY column_name - handle backticks
+        match = _PK_RE.search(part)
         if match:
-            col_name = match.group(1)
-            return col_name.strip('`').strip('"').strip("'")
+            return sys.intern(match.group(1) or match.group(2))
         
         return None
     except (ValueError, IndexError, AttributeError) as e:
-        logging.error("Error extracting primary key from '%s': %s", part, str(e))
+        logger.error("Error extracting primary key from '%s': %s", part, str(e))
         return None
 
 
@@ -340,35 +424,21 @@ def _extract_foreign_key(part: str) -> Optional[Tuple[str, str, str]]:
     """
     try:
         # Pattern 1: FOREIGN KEY (local_col) REFERENCES ref_table (ref_col)
-        match = re.search(
-            r'FOREIGN\s+KEY\s*\([`"]?(\w+)[`"]?\)\s+REFERENCES\s+[`"]?(\w+)[`"]?\s*\([`"]?(\w+)[`"]?\)',
-            part,
-            re.IGNORECASE
-        )
+        match = _FK_RE.search(part)
         
         if match:
-            local_col = match.group(1).strip('`').strip('"').strip("'")
-            ref_table = match.group(2).strip('`').strip('"').strip("'")
-            ref_col = match.group(3).strip('`').strip('"').strip("'")
-            return local_col, ref_table, ref_col
+            return tuple(map(sys.intern, match.groups()))
         
         # Pattern 2: CONSTRAINT name FOREIGN KEY (local_col) REFERENCES ref_table (ref_col)
         # This is handled by the same pattern above since we search for FOREIGN KEY
         
         # Pattern 3: local_col REFERENCES ref_table (ref_col) - standalone (without FOREIGN KEY)
-        match = re.search(
-            r'^[`"]?(\w+)[`"]?\s+REFERENCES\s+[`"]?(\w+)[`"]?\s*\([`"]?(\w+)[`"]?\)',
-            part,
-            re.IGNORECASE
-        )
+        match = _INLINE_FK_RE.match(part)
         
         if match:
-            local_col = match.group(1).strip('`').strip('"').strip("'")
-            ref_table = match.group(2).strip('`').strip('"').strip("'")
-            ref_col = match.group(3).strip('`').strip('"').strip("'")
-            return local_col, ref_table, ref_col
+            return tuple(map(sys.intern, match.groups()))
         
         return None
     except (ValueError, IndexError, AttributeError) as e:
-        logging.error("Error extracting foreign key from '%s': %s", part, str(e))
+        logger.error("Error extracting foreign key from '%s': %s", part, str(e))
         return None
@@ -17,8 +17,29 @@ sys.path.insert(0, str(Path(__file__).parent.parent))
 from core.utils.parser import parse_sql_schema
 from core.utils.graph import get_insertion_order
 from core.utils.generator import generate_data
-import pprint
+import json
 from datetime import datetime
+from itertools import islice
+from operator import itemgetter
+
+# Rows per multi-row INSERT statement in the exported SQL file
+INSERT_BATCH_SIZE = 500
+
+
+def _format_str(value):
+    """Escape single quotes and wrap a string in quotes."""
+    return "'" + value.replace("'", "''") + "'"
+
+
+# Formatters for the exact types generated most often, keyed by type(value)
+_FORMATTERS = {
+    type(None): lambda value: 'NULL',
+    bool: lambda value: '1' if value else '0',
+    int: str,
+    float: str,
+    str: _format_str,
+    datetime: lambda value: "'" + value.strftime('%Y-%m-%d %H:%M:%S') + "'",
+}
 
 
 def format_value_for_sql(value):
@@ -31,6 +52,14 @@ def format_value_for_sql(value):
     Returns:
         SQL-formatted string
     """
+    formatter = _FORMATTERS.get(type(value))
+    if formatter is not None:
+        return formatter(value)
+    return _format_generic(value)
+
+
+def _format_generic(value):
+    """Format values of other types (subclasses, dates, decimals, ...)."""
     if value is None:
         return 'NULL'
     elif isinstance(value, bool):
@@ -45,18 +74,37 @@ def format_value_for_sql(value):
         return f"'{escaped}'"
 
 
-def generate_insert_statements(generated_data, schema):
+def generate_insert_statements(generated_data, schema, batch_size=None):
     """
     Generate INSERT SQL statements from generated data.
     
     Args:
         generated_data: Dictionary mapping table names to lists of records
         schema: Parsed schema dictionary
+        batch_size: Rows per multi-row INSERT statement (None for one
+                    statement per record)
         
     Returns:
         String containing all INSERT statements
     """
-    insert_statements = []
+    return ''.join(iter_insert_statements(generated_data, schema, batch_size))
+
+
+def iter_insert_statements(generated_data, schema, batch_size=None):
+    """
+    Generate INSERT SQL statements from generated data, one line at a time.
+    
+    Args:
+        generated_data: Dictionary mapping table names to lists of records
+        schema: Parsed schema dictionary
+        batch_size: Rows per multi-row INSERT statement (None for one
+                    statement per record)
+        
+    Yields:
+        One newline-terminated INSERT statement per record (or per batch of
+        records), with an empty line between tables
+    """
+    first_table = True
     
     # Get insertion order to maintain foreign key dependencies
     try:
@@ -70,28 +118,46 @@ def generate_insert_statements(generated_data, schema):
             continue
         
         table_info = schema.get(table_name, {})
-        columns = list(table_info.get('columns', {}).keys())
+        columns = tuple(table_info.get('columns', ()))
         
-        # Generate INSERT statement for each record
-        for record in records:
-            # Build column names
-            col_names = ', '.join(columns)
-            
-            # Build values
-            values = []
-            for col in columns:
-                value = record.get(col)
-                values.append(format_value_for_sql(value))
-            
-            values_str = ', '.join(values)
-            
-            # Create INSERT statement
-            insert_stmt = f"INSERT INTO {table_name} ({col_names}) VALUES ({values_str});"
-            insert_statements.append(insert_stmt)
+        # Column names are the same for every record of the table
+        col_names = ', '.join(columns)
+        prefix = f"INSERT INTO {table_name} ({col_names}) VALUES "
         
-        insert_statements.append('')  # Empty line between tables
-    
-    return '\n'.join(insert_statements)
+        if not first_table:
+            yield '\n'  # Empty line between tables
+        first_table = False
+        
+        tuples = _iter_value_tuples(records, columns)
+        if not batch_size:
+            # Generate INSERT statement for each record
+            for values in tuples:
+                yield prefix + values + ';\n'
+        else:
+            # The prefix is written once per batch of rows
+            while True:
+                batch = list(islice(tuples, batch_size))
+                if not batch:
+                    break
+                yield prefix + ', '.join(batch) + ';\n'
+
+
+def _iter_value_tuples(records, columns):
+    """Yield the formatted '(v1, v2, ...)' value tuple of each record."""
+    fmt = format_value_for_sql
+    if len(columns) > 1:
+        # Fetch all values of a record in one C call; records missing a
+        # column fall back to .get so the value is written as NULL
+        getter = itemgetter(*columns)
+        for record in records:
+            try:
+                values = getter(record)
+            except KeyError:
+                values = map(record.get, columns)
+            yield '(' + ', '.join(map(fmt, values)) + ')'
+    else:
+        for record in records:
+            yield '(' + ', '.join(map(fmt, map(record.get, columns))) + ')'
 
 
 def main():
@@ -108,14 +174,16 @@ def main():
     sql_file = os.path.join(outputs_dir, f'insert_statements_{timestamp}.sql')
     
     # Open log file for writing
-    with open(log_file, 'w', encoding='utf-8') as log:
+    # Buffered: the log is flushed when the file is closed, not per line
+    with open(log_file, 'w', encoding='utf-8', buffering=1 << 16) as log:
         
         def log_print(*args, **kwargs):
             """Print to both console and log file."""
-            message = ' '.join(str(arg) for arg in args)
-            print(message)
-            log.write(message + '\n')
-            log.flush()
+            message = ' '.join(str(arg) for arg in args) + '\n'
+            sys.stdout.write(message)
+            log.write(message)
+        
+        log_only = log.write
         
         # Complex SQL schema with multiple tables and dependencies
         sql_content = """
@@ -247,8 +315,9 @@ def main():
         log_print("-" * 80)
         for table_name, table_info in schema.items():
             log_print(f"\n[*] Table: {table_name}")
+            columns = table_info.get('columns', {})
             log_print(f"   Primary Key: {table_info.get('primary_key', 'None')}")
-            log_print(f"   Columns ({len(table_info.get('columns', {}))}): {list(table_info.get('columns', {}).keys())}")
+            log_print(f"   Columns ({len(columns)}): {list(columns.keys())}")
             foreign_keys = table_info.get('foreign_keys', {})
             if foreign_keys:
                 log_print(f"   Foreign Keys ({len(foreign_keys)}):")
@@ -273,28 +342,24 @@ def main():
             log_print("\n\nInsertion Order (respecting foreign key constraints):")
             log_print("-" * 80)
             for idx, table_name in enumerate(insertion_order, 1):
-                table_info = schema[table_name]
-                fk_count = len(table_info.get('foreign_keys', {}))
-                if fk_count > 0:
+                foreign_keys = schema[table_name].get('foreign_keys') or {}
+                if foreign_keys:
                     fk_info = ", ".join([f"{fk}->{info['ref_table']}" 
-                                        for fk, info in table_info.get('foreign_keys', {}).items()])
+                                        for fk, info in foreign_keys.items()])
                     log_print(f"{idx:2d}. {table_name:15s} (depends on: {fk_info})")
                 else:
                     log_print(f"{idx:2d}. {table_name:15s} (no dependencies)")
                     
             log_print("\n\nDependency Chain Visualization:")
             log_print("-" * 80)
-            log_print("countries (no deps)")
-            log_print("  +--> cities (depends on: countries)")
-            log_print("        +--> users (depends on: cities)")
-            log_print("              +--> posts (depends on: users, categories)")
-            log_print("                    +--> comments (depends on: posts, users)")
-            log_print("                    +--> likes (depends on: posts, users)")
-            log_print("                    +--> post_tags (depends on: posts, tags)")
-            log_print("categories (no deps)")
-            log_print("  +--> posts (depends on: categories)")
-            log_print("tags (no deps)")
-            log_print("  +--> post_tags (depends on: tags)")
+            # Derived from the insertion order, so it holds for any schema
+            for table_name in insertion_order:
+                foreign_keys = schema[table_name].get('foreign_keys') or {}
+                if foreign_keys:
+                    ref_tables = dict.fromkeys(info['ref_table'] for info in foreign_keys.values())
+                    log_print(f"{table_name} <- {', '.join(ref_tables)}")
+                else:
+                    log_print(f"{table_name} (no deps)")
             
         except ValueError as e:
             log_print(f"\n[ERROR] Error: {e}")
@@ -310,14 +375,17 @@ def main():
         log_print("-" * 80)
         
         generated_data = generate_data(sql_content, num_records=num_records)
+        total_records = sum(map(len, generated_data.values()))
         
         log_print(f"\n[OK] Data generation completed!")
         log_print(f"  Generated data for {len(generated_data)} tables")
         
         log_print("\n\nGenerated Data Summary:")
         log_print("-" * 80)
+        ref_id_cache = {}
         for table_name in insertion_order:
-            records = generated_data.get(table_name, [])
+            records = generated_data.get(table_name, ())
+            foreign_keys = schema[table_name].get('foreign_keys') or {}
             log_print(f"\n[+] {table_name} ({len(records)} records):")
             
             if records:
@@ -335,18 +403,21 @@ def main():
                     log_print(f"      ... and {len(first_record) - 5} more fields")
                 
                 # Validate foreign keys
-                table_info = schema[table_name]
-                foreign_keys = table_info.get('foreign_keys', {})
                 if foreign_keys:
                     log_print(f"   Foreign Key Validation:")
                     for fk_col, fk_info in foreign_keys.items():
                         ref_table = fk_info['ref_table']
                         ref_col = fk_info['ref_column']
                         if ref_table in generated_data:
-                            ref_ids = {r[ref_col] for r in generated_data[ref_table] if ref_col in r}
+                            # Referenced ids are shared by every FK pointing at the same column
+                            ref_ids = ref_id_cache.get((ref_table, ref_col))
+                            if ref_ids is None:
+                                ref_ids = {r[ref_col] for r in generated_data[ref_table] if ref_col in r}
+                                ref_id_cache[(ref_table, ref_col)] = ref_ids
                             fk_values = {r[fk_col] for r in records if fk_col in r and r[fk_col] is not None}
-                            invalid = fk_values - ref_ids
-                            if invalid:
+                            # issubset stops at the first miss and builds no new set
+                            if not fk_values.issubset(ref_ids):
+                                invalid = fk_values - ref_ids
                                 log_print(f"      [ERROR] {fk_col} -> {ref_table}.{ref_col}: {len(invalid)} invalid references")
                             else:
                                 null_count = sum(1 for r in records if r.get(fk_col) is None)
@@ -358,20 +429,21 @@ def main():
         log_print("="*80)
         
         # Show ALL records for ALL tables
-        log_print("\nDetailed preview of ALL records for ALL tables:")
+        log_print("\nDetailed preview of ALL records for ALL tables (records in log file):")
         log_print("-" * 80)
         
         for table_name in insertion_order:
-            records = generated_data.get(table_name, [])
+            records = generated_data.get(table_name, ())
             if records:
                 log_print(f"\n{'='*80}")
                 log_print(f"Table: {table_name} ({len(records)} records)")
                 log_print(f"{'='*80}")
+                # The record dump goes to the log file only; the console
+                # gets the table headers
                 for idx, record in enumerate(records, 1):
-                    log_print(f"\nRecord #{idx}:")
-                    # Use pprint format for better readability
-                    record_str = pprint.pformat(record, width=80, depth=1)
-                    log_print(record_str)
+                    # One JSON line per record; json.dumps is C-accelerated, unlike pprint
+                    record_str = json.dumps(record, default=str, ensure_ascii=False)
+                    log_only(f"\nRecord #{idx}:\n{record_str}\n")
         
         log_print("\n\n" + "="*80)
         log_print("STEP 5: GENERATING INSERT SQL STATEMENTS")
@@ -380,25 +452,25 @@ def main():
         log_print("\nGenerating INSERT SQL statements...")
         log_print("-" * 80)
         
-        # Generate INSERT statements
-        insert_sql = generate_insert_statements(generated_data, schema)
-        
-        # Write INSERT statements to file
-        with open(sql_file, 'w', encoding='utf-8') as f:
+        # Stream INSERT statements to file without building the whole SQL text
+        with open(sql_file, 'w', encoding='utf-8', buffering=1 << 20) as f:
             f.write("-- Generated INSERT statements\n")
             f.write(f"-- Generated at: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n")
             f.write(f"-- Total tables: {len(generated_data)}\n")
-            f.write(f"-- Total records: {sum(len(records) for records in generated_data.values())}\n")
+            f.write(f"-- Total records: {total_records}\n")
             f.write("\n\n")
-            f.write(insert_sql)
+            f.writelines(iter_insert_statements(generated_data, schema, INSERT_BATCH_SIZE))
         
         log_print(f"\n[OK] INSERT statements saved to: {sql_file}")
-        log_print(f"  Total INSERT statements: {insert_sql.count('INSERT INTO')}")
+        # One multi-row INSERT statement is written per batch of records
+        total_statements = sum(
+            -(-len(records) // INSERT_BATCH_SIZE) for records in generated_data.values()
+        )
+        log_print(f"  Total INSERT statements: {total_statements}")
         
         log_print("\n\n" + "="*80)
         log_print("SUMMARY")
         log_print("="*80)
-        total_records = sum(len(records) for records in generated_data.values())
         log_print(f"""
 [OK] Parsed {len(schema)} tables from SQL schema
 [OK] Built dependency graph with {len(insertion_order)} nodes
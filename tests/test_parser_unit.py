@@ -101,6 +101,24 @@ class TestSQLParser(unittest.TestCase):
         self.assertIn('id', result['test']['columns'])
         self.assertIn('name', result['test']['columns'])
     
+    def test_keyword_prefixed_columns_parsed(self):
+        """Test that columns whose names start with a keyword are kept."""
+        sql = """
+        CREATE TABLE test (
+          id INT,
+          keywords TEXT,
+          index_id INT,
+          checked_at DATETIME,
+          UNIQUE KEY uk_index (index_id),
+          CHECK (id > 0)
+        );
+        """
+        result = parse_sql_schema(sql)
+        self.assertEqual(
+            result['test']['columns'],
+            {'id': 'INT', 'keywords': 'TEXT', 'index_id': 'INT', 'checked_at': 'DATETIME'}
+        )
+    
     def test_constraint_foreign_key_parsed_correctly(self):
         """Test that CONSTRAINT ... FOREIGN KEY is parsed correctly."""
         sql = """
@@ -140,6 +158,73 @@ class TestSQLParser(unittest.TestCase):
         self.assertIn('id', result['test_table']['columns'])
         self.assertIn('name', result['test_table']['columns'])
     
+    def test_comments_and_quoted_semicolons(self):
+        """Test that comments and semicolons inside quotes do not split tables."""
+        sql = """
+        -- Table structure for table `notes`
+        CREATE TABLE notes (
+          id INT PRIMARY KEY, -- surrogate key, (auto)
+          body VARCHAR(20) DEFAULT 'a;b',
+          /* author; optional */ author_id INT
+        );
+        /*!40101 SET character_set_client = utf8 */;
+        CREATE TABLE `tags;` (id INT);
+        """
+        result = parse_sql_schema(sql)
+        self.assertEqual(
+            result['notes']['columns'],
+            {'id': 'INT', 'body': 'VARCHAR(20)', 'author_id': 'INT'}
+        )
+        self.assertEqual(result['notes']['primary_key'], 'id')
+        self.assertEqual(sorted(result), ['notes', 'tags'])
+    
+    def test_parse_result_cached_by_content(self):
+        """Test that parsing the same content again reuses the parsed schema."""
+        from unittest import mock
+        from core.utils import parser
+        
+        sql = "CREATE TABLE cached_test (id INT PRIMARY KEY, name VARCHAR(20));"
+        first = parse_sql_schema(sql)
+        with mock.patch.object(parser, '_parse_sql_schema', wraps=parser._parse_sql_schema) as parse:
+            self.assertEqual(parse_sql_schema(sql), first)
+            parse.assert_not_called()
+            self.assertEqual(parse_sql_schema(sql + "\n"), first)
+            parse.assert_called_once()
+    
+    def test_parse_cache_thread_safe(self):
+        """Test that concurrent parses with cache eviction neither fail nor mix results."""
+        from concurrent.futures import ThreadPoolExecutor
+        from unittest import mock
+        from core.utils import parser
+        
+        def parse(index):
+            name = f'threaded_{index % 12}'
+            return name, parse_sql_schema(f"CREATE TABLE {name} (id INT PRIMARY KEY);")
+        
+        parser.clear_schema_cache()
+        with mock.patch.object(parser, 'SCHEMA_CACHE_SIZE', 4):
+            with ThreadPoolExecutor(max_workers=8) as executor:
+                for name, schema in executor.map(parse, range(400)):
+                    self.assertEqual(list(schema), [name])
+            
+            self.assertLessEqual(len(parser._schema_cache), 4)
+    
+    def test_cached_parse_result_not_shared(self):
+        """Test that mutating one parse result leaves later results unchanged."""
+        sql = """
+        CREATE TABLE a (id INT PRIMARY KEY);
+        CREATE TABLE b (id INT PRIMARY KEY, a_id INT, FOREIGN KEY (a_id) REFERENCES a(id));
+        """
+        first = parse_sql_schema(sql)
+        expected = parse_sql_schema(sql)
+        
+        first['a']['columns']['x'] = 'INT'
+        first['b']['foreign_keys']['a_id']['ref_table'] = 'other'
+        first['c'] = {}
+        
+        self.assertEqual(parse_sql_schema(sql), expected)
+        self.assertNotIn('x', parse_sql_schema(sql)['a']['columns'])
+    
     def test_complex_schema_with_graph(self):
         """Test a complex SQL schema and verify graph insertion order."""
         # Complex schema with multiple dependencies
@@ -282,37 +367,29 @@ class TestSQLParser(unittest.TestCase):
         self.assertIn('post_tags', insertion_order)
         self.assertIn('likes', insertion_order)
         
-        # Check dependency order
-        countries_idx = insertion_order.index('countries')
-        cities_idx = insertion_order.index('cities')
-        users_idx = insertion_order.index('users')
-        posts_idx = insertion_order.index('posts')
-        comments_idx = insertion_order.index('comments')
-        post_tags_idx = insertion_order.index('post_tags')
-        tags_idx = insertion_order.index('tags')
-        likes_idx = insertion_order.index('likes')
+        # Check dependency order (positions looked up once)
+        pos = {table_name: idx for idx, table_name in enumerate(insertion_order)}
         
         # Verify dependency chains
-        self.assertLess(countries_idx, cities_idx, 
+        self.assertLess(pos['countries'], pos['cities'], 
                        "countries must come before cities")
-        self.assertLess(cities_idx, users_idx, 
+        self.assertLess(pos['cities'], pos['users'], 
                        "cities must come before users")
-        self.assertLess(users_idx, posts_idx, 
+        self.assertLess(pos['users'], pos['posts'], 
                        "users must come before posts")
-        self.assertLess(posts_idx, comments_idx, 
+        self.assertLess(pos['posts'], pos['comments'], 
                        "posts must come before comments")
-        self.assertLess(posts_idx, post_tags_idx, 
+        self.assertLess(pos['posts'], pos['post_tags'], 
                        "posts must come before post_tags")
-        self.assertLess(tags_idx, post_tags_idx, 
+        self.assertLess(pos['tags'], pos['post_tags'], 
                        "tags must come before post_tags")
-        self.assertLess(users_idx, likes_idx, 
+        self.assertLess(pos['users'], pos['likes'], 
                        "users must come before likes")
-        self.assertLess(posts_idx, likes_idx, 
+        self.assertLess(pos['posts'], pos['likes'], 
                        "posts must come before likes")
         
         # Categories can be anywhere, but posts depends on it
-        categories_idx = insertion_order.index('categories')
-        self.assertLess(categories_idx, posts_idx, 
+        self.assertLess(pos['categories'], pos['posts'], 
                        "categories must come before posts")
 
 
@@ -450,6 +527,22 @@ class TestDataGenerator(unittest.TestCase):
         self.assertIsInstance(record['phone'], str)
         self.assertIsInstance(record['created_at'], type(record['created_at']))  # datetime object
     
+    def test_smart_keyword_falls_back_to_type(self):
+        """Test that name keywords without a provider fall back to the column type."""
+        sql_content = """
+        CREATE TABLE test_table (
+          id INT PRIMARY KEY,
+          city_id INT,
+          country_code_id INT
+        );
+        """
+        
+        data = generate_data(sql_content, num_records=5)
+        
+        for record in data['test_table']:
+            self.assertIsInstance(record['city_id'], int)
+            self.assertIsInstance(record['country_code_id'], int)
+    
     def test_primary_key_auto_increment(self):
         """Test that primary keys are auto-incremented correctly."""
         sql_content = """
@@ -494,6 +587,147 @@ class TestDataGenerator(unittest.TestCase):
         self.assertTrue(any(r['parent_id'] is None for r in data['child']) or 
                        all(r['parent_id'] is not None for r in data['child']))
     
+    def test_generate_columnar(self):
+        """Test that columnar output holds the same rows as generate()."""
+        from core.utils.generators.data_generator import DataGenerator
+        
+        sql_content = """
+        CREATE TABLE parent (
+          id INT PRIMARY KEY,
+          name VARCHAR(50)
+        );
+
+        CREATE TABLE child (
+          id INT PRIMARY KEY,
+          parent_id INT,
+          FOREIGN KEY (parent_id) REFERENCES parent(id)
+        );
+        """
+        
+        tables = DataGenerator().generate_columnar(sql_content, num_records=5)
+        parent = tables['parent']
+        
+        self.assertEqual(len(parent), 5)
+        self.assertEqual(parent.columns['id'], [1, 2, 3, 4, 5])
+        self.assertEqual([record['id'] for record in parent], [1, 2, 3, 4, 5])
+        self.assertEqual(list(parent.rows(['id'])), [(1,), (2,), (3,), (4,), (5,)])
+        for record in tables['child']:
+            self.assertIn(record['parent_id'], [None, 1, 2, 3, 4, 5])
+    
+    def test_seed_reproducibility(self):
+        """Test that the same seed reproduces the same data, foreign keys included."""
+        from core.utils.generators.config import GeneratorConfig
+        from core.utils.generators.data_generator import DataGenerator
+        
+        sql_content = """
+        CREATE TABLE parent (
+          id INT PRIMARY KEY,
+          name VARCHAR(50)
+        );
+
+        CREATE TABLE child (
+          id INT PRIMARY KEY,
+          title VARCHAR(100),
+          parent_id INT,
+          FOREIGN KEY (parent_id) REFERENCES parent(id)
+        );
+        """
+        
+        first = DataGenerator(GeneratorConfig(seed=7)).generate(sql_content, num_records=20)
+        second = DataGenerator(GeneratorConfig(seed=7)).generate(sql_content, num_records=20)
+        
+        self.assertEqual(first, second)
+    
+    def test_worker_processes_shard_tables(self):
+        """Test that sharded worker generation keeps keys contiguous, FKs valid and seeds stable."""
+        from core.utils.generators.config import GeneratorConfig
+        from core.utils.generators.data_generator import DataGenerator
+        
+        sql_content = """
+        CREATE TABLE parent (
+          id INT PRIMARY KEY,
+          name VARCHAR(50)
+        );
+
+        CREATE TABLE child (
+          id INT PRIMARY KEY,
+          title VARCHAR(100),
+          parent_id INT,
+          FOREIGN KEY (parent_id) REFERENCES parent(id)
+        );
+        """
+        
+        def generate():
+            # Every layer has a single table, so each is split across both workers
+            config = GeneratorConfig(seed=11, workers=2, parallel_threshold=1)
+            return DataGenerator(config).generate(sql_content, num_records=40)
+        
+        data = generate()
+        
+        parent_ids = [r['id'] for r in data['parent']]
+        self.assertEqual(parent_ids, list(range(1, 41)))
+        self.assertEqual([r['id'] for r in data['child']], list(range(1, 41)))
+        
+        fk_values = {r['parent_id'] for r in data['child']} - {None}
+        self.assertTrue(fk_values)
+        self.assertTrue(fk_values.issubset(parent_ids))
+        
+        self.assertEqual(generate(), data)
+    
+    def test_decimal_precision_and_scale(self):
+        """Test that DECIMAL(p,s) values fit the declared precision and scale."""
+        sql_content = """
+        CREATE TABLE products (
+          id INT PRIMARY KEY,
+          price DECIMAL(5,2)
+        );
+        """
+        
+        data = generate_data(sql_content, num_records=50)
+        
+        for record in data['products']:
+            self.assertLess(abs(record['price']), 1000)
+            self.assertEqual(record['price'], round(record['price'], 2))
+    
+    def test_value_pool_for_large_columns(self):
+        """Test that large columns sample from a value pool, except for unique-like fields."""
+        from core.utils.generators.config import GeneratorConfig
+        from core.utils.generators.data_generator import DataGenerator
+        
+        sql_content = """
+        CREATE TABLE test_table (
+          id INT PRIMARY KEY,
+          address VARCHAR(255),
+          email VARCHAR(255)
+        );
+        """
+        
+        generator = DataGenerator(GeneratorConfig(seed=1, pool_size=5))
+        records = generator.generate(sql_content, num_records=50)['test_table']
+        
+        self.assertLessEqual(len({r['address'] for r in records}), 5)
+        self.assertGreater(len({r['email'] for r in records}), 5)
+    
+    def test_string_pooling_is_opt_in(self):
+        """Test that generic string columns are only pooled when enabled."""
+        from core.utils.generators.config import GeneratorConfig
+        from core.utils.generators.data_generator import DataGenerator
+        
+        sql_content = """
+        CREATE TABLE test_table (
+          id INT PRIMARY KEY,
+          label VARCHAR(100)
+        );
+        """
+        
+        default = DataGenerator(GeneratorConfig(seed=1, pool_size=5))
+        records = default.generate(sql_content, num_records=50)['test_table']
+        self.assertGreater(len({r['label'] for r in records}), 5)
+        
+        pooled = DataGenerator(GeneratorConfig(seed=1, pool_size=5, pool_strings=True))
+        records = pooled.generate(sql_content, num_records=50)['test_table']
+        self.assertLessEqual(len({r['label'] for r in records}), 5)
+    
     def test_empty_schema(self):
         """Test generator with empty/invalid schema."""
         # Empty schema should raise ValueError
@@ -563,6 +797,37 @@ class TestGraphModule(unittest.TestCase):
         self.assertLess(users_idx, posts_idx)
         self.assertLess(categories_idx, posts_idx)
     
+    def test_insertion_layers(self):
+        """Test that independent tables share a layer ahead of their dependents."""
+        from core.utils.graph import get_insertion_layers
+        
+        schema = {
+            'users': {
+                'columns': {'id': 'INT'},
+                'primary_key': 'id',
+                'foreign_keys': {}
+            },
+            'categories': {
+                'columns': {'id': 'INT'},
+                'primary_key': 'id',
+                'foreign_keys': {}
+            },
+            'posts': {
+                'columns': {'id': 'INT', 'user_id': 'INT', 'category_id': 'INT'},
+                'primary_key': 'id',
+                'foreign_keys': {
+                    'user_id': {'ref_table': 'users', 'ref_column': 'id'},
+                    'category_id': {'ref_table': 'categories', 'ref_column': 'id'}
+                }
+            }
+        }
+        
+        layers = get_insertion_layers(schema)
+        
+        self.assertEqual(len(layers), 2)
+        self.assertEqual(sorted(layers[0]), ['categories', 'users'])
+        self.assertEqual(layers[1], ['posts'])
+    
     def test_circular_dependency_detection(self):
         """Test that circular dependencies are detected."""
         schema = {
@@ -585,6 +850,59 @@ class TestGraphModule(unittest.TestCase):
         self.assertIn('table_a', str(context.exception))
         self.assertIn('table_b', str(context.exception))
     
+    def test_circular_dependency_reports_cycle_tables_only(self):
+        """Test that tables merely depending on a cycle are not reported."""
+        from core.exceptions import CircularDependencyError
+        
+        schema = {
+            'table_a': {
+                'columns': {'id': 'INT', 'b_id': 'INT'},
+                'primary_key': 'id',
+                'foreign_keys': {'b_id': {'ref_table': 'table_b', 'ref_column': 'id'}}
+            },
+            'table_b': {
+                'columns': {'id': 'INT', 'a_id': 'INT'},
+                'primary_key': 'id',
+                'foreign_keys': {'a_id': {'ref_table': 'table_a', 'ref_column': 'id'}}
+            },
+            'table_c': {
+                'columns': {'id': 'INT', 'a_id': 'INT'},
+                'primary_key': 'id',
+                'foreign_keys': {'a_id': {'ref_table': 'table_a', 'ref_column': 'id'}}
+            }
+        }
+        
+        with self.assertRaises(CircularDependencyError) as context:
+            get_insertion_order(schema)
+        
+        self.assertEqual(context.exception.tables, ['table_a', 'table_b'])
+    
+    def test_insertion_order_cached_by_foreign_keys(self):
+        """Test that equal schemas share a sort but different edges do not."""
+        from core.utils.graph import dependency_graph, get_insertion_layers
+        
+        def make_schema(child, parent):
+            schema = {
+                'x': {'columns': {'id': 'INT', 'ref_id': 'INT'}, 'primary_key': 'id', 'foreign_keys': {}},
+                'y': {'columns': {'id': 'INT', 'ref_id': 'INT'}, 'primary_key': 'id', 'foreign_keys': {}}
+            }
+            schema[child]['foreign_keys']['ref_id'] = {'ref_table': parent, 'ref_column': 'id'}
+            return schema
+        
+        order = get_insertion_order(make_schema('x', 'y'))
+        self.assertEqual(order, ['y', 'x'])
+        
+        # Callers get their own list, so mutating it does not affect the cache
+        order.clear()
+        self.assertEqual(get_insertion_order(make_schema('x', 'y')), ['y', 'x'])
+        self.assertEqual(get_insertion_order(make_schema('y', 'x')), ['x', 'y'])
+        self.assertEqual(get_insertion_layers(make_schema('x', 'y')), [['y'], ['x']])
+        
+        # Only table names are cached, never the schema dicts themselves
+        for order, layers in dependency_graph._order_cache.values():
+            self.assertTrue(all(isinstance(name, str) for name in order))
+            self.assertTrue(all(isinstance(name, str) for layer in layers for name in layer))
+    
     def test_independent_tables(self):
         """Test schema with independent tables (no foreign keys)."""
         schema = {
@@ -655,6 +973,41 @@ class TestSchemaService(unittest.TestCase):
         self.assertIn('countries', result['sql'])
         self.assertIn('users', result['sql'])
     
+    def test_service_schema_results_independent(self):
+        """Test that repeated calls give equal but independent schema results."""
+        from core.services.schema_service import SchemaService
+        from core.utils import parser
+        from core.utils.graph import dependency_graph
+        
+        sql_content = """
+        CREATE TABLE authors (id INT PRIMARY KEY);
+        CREATE TABLE books (
+          id INT PRIMARY KEY,
+          author_id INT,
+          FOREIGN KEY (author_id) REFERENCES authors(id)
+        );
+        """
+        
+        service = SchemaService()
+        first = service.parse_only(sql_content)
+        second = service.parse_only(sql_content)
+        
+        self.assertEqual(second['schema'], first['schema'])
+        self.assertEqual(second['insertion_order'], ['authors', 'books'])
+        self.assertIsNot(second['insertion_order'], first['insertion_order'])
+        
+        # A caller modifying its result does not affect later calls
+        first['schema']['authors']['columns']['extra'] = 'INT'
+        self.assertNotIn('extra', service.parse_only(sql_content)['schema']['authors']['columns'])
+        
+        # clear_cache() resets both process-wide caches
+        service.clear_cache()
+        self.assertFalse(parser._schema_cache)
+        self.assertFalse(dependency_graph._order_cache)
+        
+        third = service.parse_only(sql_content)
+        self.assertEqual(third['schema'], second['schema'])
+    
     def test_service_with_custom_config(self):
         """Test service with custom generator configuration."""
         from core.services.schema_service import SchemaService
@@ -692,6 +1045,132 @@ class TestSchemaService(unittest.TestCase):
         self.assertIn('insertion_order', result)
         self.assertIn('has_cycles', result)
         self.assertFalse(result['has_cycles'])
+    
+    def test_service_export_to_file(self):
+        """Test that process_schema can stream the SQL export to a file."""
+        import os
+        import tempfile
+        from core.services.schema_service import SchemaService
+        
+        sql_content = """
+        CREATE TABLE test (
+          id INT PRIMARY KEY,
+          name VARCHAR(50)
+        );
+        """
+        
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            sql_path = os.path.join(tmp_dir, 'out.sql')
+            result = SchemaService().process_schema(
+                sql_content, num_records=3, export_sql=True, sql_path=sql_path
+            )
+            
+            self.assertEqual(result['sql_path'], sql_path)
+            self.assertNotIn('sql', result)
+            with open(sql_path, encoding='utf-8') as f:
+                self.assertIn('INSERT INTO test (id, name) VALUES', f.read())
+    
+    def test_service_file_export_stays_columnar(self):
+        """Test that exporting to a file never materializes row dicts."""
+        import os
+        import tempfile
+        from unittest import mock
+        from core.services.schema_service import SchemaService
+        from core.utils.generators.table_data import TableData
+        
+        sql_content = """
+        CREATE TABLE users (
+          id INT PRIMARY KEY,
+          name VARCHAR(50)
+        );
+        
+        CREATE TABLE posts (
+          id INT PRIMARY KEY,
+          user_id INT,
+          FOREIGN KEY (user_id) REFERENCES users(id)
+        );
+        """
+        
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            sql_path = os.path.join(tmp_dir, 'out.sql')
+            with mock.patch.object(TableData, 'to_records', side_effect=AssertionError) as to_records:
+                result = SchemaService().process_schema(
+                    sql_content, num_records=4, export_sql=True, sql_path=sql_path
+                )
+            
+            to_records.assert_not_called()
+            for table_data in result['data'].values():
+                self.assertIsInstance(table_data, TableData)
+            self.assertEqual(result['metadata']['total_records'], 8)
+            with open(sql_path, encoding='utf-8') as f:
+                sql = f.read()
+            self.assertIn('INSERT INTO users (id, name) VALUES', sql)
+            self.assertIn('INSERT INTO posts (id, user_id) VALUES', sql)
+
+
+class TestSQLInsertBuilder(unittest.TestCase):
+    """Test cases for the SQL INSERT builder."""
+    
+    def test_stream_to_external_sink(self):
+        """Test that statements are written to a provided sink."""
+        import io
+        from core.utils.exporters.sql_exporter import SQLInsertBuilder
+        
+        sink = io.StringIO()
+        builder = SQLInsertBuilder(sink=sink, batch_size=1)
+        builder.add_metadata(total_tables=1, total_records=2)
+        builder.add_table('users', [{'id': 1, 'name': "O'Brien"}, {'id': 2, 'name': None}])
+        
+        self.assertEqual(builder.build(), '')
+        output = sink.getvalue()
+        self.assertTrue(output.startswith('-- Generated INSERT statements'))
+        self.assertIn("INSERT INTO users (id, name) VALUES (1, 'O''Brien');", output)
+        self.assertIn("INSERT INTO users (id, name) VALUES (2, NULL);", output)
+    
+    def test_multi_row_batches(self):
+        """Test that rows are grouped into multi-row INSERT statements."""
+        from core.utils.exporters.sql_exporter import SQLInsertBuilder
+        
+        records = [{'id': i} for i in range(1, 6)]
+        sql = SQLInsertBuilder(batch_size=2).add_table('t', records).build()
+        
+        self.assertEqual(sql.count('INSERT INTO'), 3)
+        self.assertIn("INSERT INTO t (id) VALUES (1),\n(2);", sql)
+        self.assertIn("INSERT INTO t (id) VALUES (5);", sql)
+    
+    def test_string_escaping_per_dialect(self):
+        """Test quote, backslash and NUL handling for MySQL and PostgreSQL."""
+        from core.utils.exporters.sql_exporter import SQLInsertBuilder
+        
+        records = [{'v': "it's"}, {'v': 'a\\b'}, {'v': 'x\x00y'}]
+        mysql = SQLInsertBuilder('mysql', batch_size=1).add_table('t', records).build()
+        postgres = SQLInsertBuilder('postgres', batch_size=1).add_table('t', records).build()
+        
+        for sql in (mysql, postgres):
+            self.assertIn("VALUES ('it''s');", sql)
+            # NUL characters are dropped for every dialect
+            self.assertIn("VALUES ('xy');", sql)
+        
+        # Only MySQL treats backslash as an escape character
+        self.assertIn("VALUES ('a\\\\b');", mysql)
+        self.assertIn("VALUES ('a\\b');", postgres)
+    
+    def test_metadata_after_table(self):
+        """Test that metadata added after a table still reaches the header."""
+        import io
+        from core.utils.exporters.sql_exporter import SQLInsertBuilder
+        
+        builder = SQLInsertBuilder().add_table('t', [{'id': 1}])
+        sql = builder.add_metadata(total_tables=1, total_records=1).build()
+        
+        self.assertTrue(sql.startswith('-- Generated INSERT statements'))
+        self.assertIn('-- Total records: 1', sql)
+        self.assertLess(sql.index('-- Total tables: 1'), sql.index('INSERT INTO t'))
+        
+        # An external sink already holds the header, so late metadata is refused
+        builder = SQLInsertBuilder(sink=io.StringIO()).add_table('t', [{'id': 1}])
+        with self.assertRaises(ValueError):
+            builder.add_metadata(total_tables=1)
 
 
 if __name__ == '__main__':